@@ -19,13 +19,14 @@ import socket
 import sys
 import threading
 import time
+from functools import lru_cache
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QFrame, QLabel,
     QGridLayout, QVBoxLayout, QHBoxLayout, QFormLayout,
     QTabWidget, QTableWidget, QTableWidgetItem, QHeaderView,
     QSpinBox, QPushButton, QLineEdit, QComboBox, QTextEdit, QScrollArea,
 )
-from PyQt6.QtCore import QTimer, Qt
+from PyQt6.QtCore import QEvent, QTimer, Qt, pyqtSignal
 from PyQt6.QtGui import QFont, QColor
 import numpy as np
 from src.protocol import FreeDParser, FreeDReceiver, FreeDReceiverGUI
@@ -36,6 +37,12 @@ from src.forwarder import FreeDForwarder
 from src.ui_utils import FONT_MONO as _FONT_MONO, FONT_SANS as _FONT_SANS, configure_stdout
 configure_stdout()
 
+
+@lru_cache(maxsize=None)
+def _font(family: str, size: int, bold: bool = False) -> QFont:
+    """Shared QFont per (family, size, weight); setFont() copies, so reuse is safe."""
+    return QFont(family, size, QFont.Weight.Bold) if bold else QFont(family, size)
+
 # Set Windows timer resolution to 1ms so packet interval measurements
 # reflect the actual source signal rather than the default 15.6ms OS tick.
 if sys.platform == 'win32':
@@ -59,11 +66,23 @@ class FreeDDashboard(QMainWindow):
     ORANGE = '#ff9f0a'
     RED    = '#ff453a'
 
+    # Emitted from the receiver thread; queued onto the GUI thread
+    _packet_ready = pyqtSignal()
+
+    MIN_REFRESH_S = 1 / 60   # packet-driven redraws are capped at display rate
+
     def __init__(self):
         super().__init__()
         self.receiver        = None
         self.recv_thread     = None
         self._cached_ip_str  = None
+        self._label_text     = {}   # QLabel -> last text set by _set_label
+        self._label_color    = {}   # QLabel -> last colour set by _set_label
+        self._label_raw      = {}   # QLabel -> raw int last formatted by _set_field
+        self._drawn_data     = None  # packet dict last rendered by _update
+        self._drawn_stale    = False
+        self._update_pending = False  # a _packet_ready emit is queued / waiting
+        self._last_refresh   = 0.0    # monotonic time of the last _do_update
         self.forwarder       = FreeDForwarder()
         self._active_port = self.forwarder.listen_port
         self.oti_sender   = OpenTrackIOSender()
@@ -80,11 +99,20 @@ class FreeDDashboard(QMainWindow):
         if self.forwarder.tc_source == 'auto':
             self.forwarder.tc_source = 'bluefish' if self.ltc_reader.available else 'system'
         self._build_ui()
-        self._start_receiver(self._active_port)
-        self.ltc_reader.start()
+        # Wire the redraw signal before the receiver thread can emit it, or a
+        # packet landing first leaves _update_pending stuck with no slot
+        self._packet_ready.connect(self._on_packet_ready)
+        # Packets drive the redraw; a 2 Hz timer catches LIVE -> TIMEOUT and
+        # receiver-thread death while the source is silent
+        self._stale_timer = QTimer(self)
+        self._stale_timer.timeout.connect(self._do_update)
+        self._stale_timer.start(500)
+        # The TC preview and forward counter run off the clock, not packets
         self._timer = QTimer(self)
-        self._timer.timeout.connect(self._do_update)
+        self._timer.timeout.connect(self._update_fwd_ui)
         self._timer.start(100)
+        self._start_receiver(self._active_port)
+        self.ltc_reader.start()
 
     # ------------------------------------------------------------------
     # Stylesheet
@@ -179,24 +207,24 @@ class FreeDDashboard(QMainWindow):
         layout.setSpacing(12)
 
         title = QLabel('FreeD DASHBOARD')
-        title.setFont(QFont(_FONT_SANS, 12, QFont.Weight.Bold))
+        title.setFont(_font(_FONT_SANS, 12, bold=True))
         title.setStyleSheet(f'color: {self.FG}; background: transparent;')
         layout.addWidget(title)
 
         self.lbl_cam = QLabel('CAM --')
-        self.lbl_cam.setFont(QFont(_FONT_SANS, 11, QFont.Weight.Bold))
+        self.lbl_cam.setFont(_font(_FONT_SANS, 11, bold=True))
         self.lbl_cam.setStyleSheet(f'color: {self.YELLOW}; background: transparent;')
         layout.addWidget(self.lbl_cam)
 
         layout.addStretch()
 
         ver = QLabel(f'{__version__}  ·  {__author__}')
-        ver.setFont(QFont(_FONT_SANS, 9))
+        ver.setFont(_font(_FONT_SANS, 9))
         ver.setStyleSheet(f'color: {self.DIM}; background: transparent;')
         layout.addWidget(ver)
 
         self.lbl_status = QLabel('● WAITING')
-        self.lbl_status.setFont(QFont(_FONT_SANS, 10, QFont.Weight.Bold))
+        self.lbl_status.setFont(_font(_FONT_SANS, 10, bold=True))
         self.lbl_status.setStyleSheet(f'color: {self.DIM}; background: transparent;')
         layout.addWidget(self.lbl_status)
 
@@ -222,8 +250,21 @@ class FreeDDashboard(QMainWindow):
         self._build_settings_tab(settings)
         tabs.addTab(settings, '  Settings  ')
 
+        # _update only renders the Packet Map / Jitter pages while they are shown
+        self._tabs        = tabs
+        self._pmap_page   = pmap
+        self._jitter_page = jitter
+        tabs.currentChanged.connect(self._on_tab_changed)
+
         return tabs
 
+    def _on_tab_changed(self, idx: int):
+        # Force a full redraw now so a page that was skipped while hidden
+        # shows current data even if no new packet arrives
+        self._drawn_data = None
+        if self.receiver is not None:
+            self._do_update()
+
     def _card(self, title: str):
         """Create a rounded card. Returns (outer_widget, QFormLayout)."""
         outer = QWidget()
@@ -238,7 +279,7 @@ class FreeDDashboard(QMainWindow):
 
         if title:
             hdr_lbl = QLabel(title)
-            hdr_lbl.setFont(QFont(_FONT_SANS, 9, QFont.Weight.Bold))
+            hdr_lbl.setFont(_font(_FONT_SANS, 9, bold=True))
             hdr_lbl.setStyleSheet(f'color: {self.DIM}; background: transparent;')
             inner.addWidget(hdr_lbl)
 
@@ -255,7 +296,7 @@ class FreeDDashboard(QMainWindow):
 
     def _key(self, text: str) -> QLabel:
         lbl = QLabel(text)
-        lbl.setFont(QFont(_FONT_SANS, 9))
+        lbl.setFont(_font(_FONT_SANS, 9))
         lbl.setStyleSheet(f'color: {self.DIM}; background: transparent;')
         lbl.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
         return lbl
@@ -263,7 +304,7 @@ class FreeDDashboard(QMainWindow):
     def _val(self, color: str, mono: bool = True, size: int = 12) -> QLabel:
         lbl = QLabel('---')
         family = _FONT_MONO if mono else _FONT_SANS
-        lbl.setFont(QFont(family, size, QFont.Weight.Bold))
+        lbl.setFont(_font(family, size, bold=True))
         lbl.setStyleSheet(f'color: {color}; background: transparent;')
         return lbl
 
@@ -316,12 +357,12 @@ class FreeDDashboard(QMainWindow):
         gl_inner.setSpacing(6)
 
         gl_title = QLabel('GENLOCK')
-        gl_title.setFont(QFont(_FONT_SANS, 9, QFont.Weight.Bold))
+        gl_title.setFont(_font(_FONT_SANS, 9, bold=True))
         gl_title.setStyleSheet(f'color: {self.DIM}; background: transparent;')
         gl_inner.addWidget(gl_title)
 
         self.lbl_gl_status = QLabel('● WAITING')
-        self.lbl_gl_status.setFont(QFont(_FONT_SANS, 15, QFont.Weight.Bold))
+        self.lbl_gl_status.setFont(_font(_FONT_SANS, 15, bold=True))
         self.lbl_gl_status.setStyleSheet(f'color: {self.DIM}; background: transparent;')
         self.lbl_gl_status.setAlignment(Qt.AlignmentFlag.AlignCenter)
         gl_inner.addWidget(self.lbl_gl_status)
@@ -337,8 +378,8 @@ class FreeDDashboard(QMainWindow):
         self.lbl_gl_ref   = self._val(self.FG,     size=10, mono=True)
         self.lbl_gl_freq  = self._val(self.ORANGE, size=14)
         self.lbl_gl_raw   = self._val(self.DIM,    size=10)
-        self.lbl_gl_ref.setFont(QFont(_FONT_MONO, 10))
-        self.lbl_gl_raw.setFont(QFont(_FONT_MONO, 10))
+        self.lbl_gl_ref.setFont(_font(_FONT_MONO, 10))
+        self.lbl_gl_raw.setFont(_font(_FONT_MONO, 10))
         gl_form.addRow(self._key('Phase'), self.lbl_gl_phase)
         gl_form.addRow(self._key('Ref'),   self.lbl_gl_ref)
         gl_form.addRow(self._key('Freq'),  self.lbl_gl_freq)
@@ -358,12 +399,12 @@ class FreeDDashboard(QMainWindow):
         st_inner.setSpacing(6)
 
         st_title = QLabel('STATUS')
-        st_title.setFont(QFont(_FONT_SANS, 9, QFont.Weight.Bold))
+        st_title.setFont(_font(_FONT_SANS, 9, bold=True))
         st_title.setStyleSheet(f'color: {self.DIM}; background: transparent;')
         st_inner.addWidget(st_title)
 
         self.lbl_tc = QLabel('--:--:--:--')
-        self.lbl_tc.setFont(QFont(_FONT_MONO, 22, QFont.Weight.Bold))
+        self.lbl_tc.setFont(_font(_FONT_MONO, 22, bold=True))
         self.lbl_tc.setStyleSheet(f'color: {self.ORANGE}; background: transparent;')
         self.lbl_tc.setAlignment(Qt.AlignmentFlag.AlignCenter)
         st_inner.addWidget(self.lbl_tc)
@@ -379,8 +420,8 @@ class FreeDDashboard(QMainWindow):
         self.lbl_source   = self._val(self.DIM, size=9, mono=False)
         self.lbl_port     = self._val(self.DIM, size=9, mono=False)
         self.lbl_interval = self._val(self.CYAN, size=11)
-        self.lbl_source.setFont(QFont(_FONT_SANS, 9))
-        self.lbl_port.setFont(QFont(_FONT_SANS, 9))
+        self.lbl_source.setFont(_font(_FONT_SANS, 9))
+        self.lbl_port.setFont(_font(_FONT_SANS, 9))
         st_form.addRow(self._key('Packets'),  self.lbl_packets)
         st_form.addRow(self._key('Source'),   self.lbl_source)
         st_form.addRow(self._key('Port'),     self.lbl_port)
@@ -396,8 +437,8 @@ class FreeDDashboard(QMainWindow):
         self.lbl_rawsize = self._val(self.FG,   size=11)
         self.lbl_hex1    = self._val('#aaaaaa',  size=9)
         self.lbl_hex2    = self._val('#aaaaaa',  size=9)
-        self.lbl_hex1.setFont(QFont(_FONT_MONO, 9))
-        self.lbl_hex2.setFont(QFont(_FONT_MONO, 9))
+        self.lbl_hex1.setFont(_font(_FONT_MONO, 9))
+        self.lbl_hex2.setFont(_font(_FONT_MONO, 9))
         raw_form.addRow(self._key('Proto'), self.lbl_proto)
         raw_form.addRow(self._key('Size'),  self.lbl_rawsize)
         raw_form.addRow(self._key('Hex'),   self.lbl_hex1)
@@ -437,7 +478,7 @@ class FreeDDashboard(QMainWindow):
             (self.DIM,    '--',       'Checksum'),
         ]
 
-        self._pm_font = QFont(_FONT_MONO, 10)
+        self._pm_font = _font(_FONT_MONO, 10)
         for i, (color, hex_ph, field) in enumerate(rows):
             qc = QColor(color)
             for col, text in enumerate([hex_ph, field, '---', '---']):
@@ -449,7 +490,8 @@ class FreeDDashboard(QMainWindow):
 
         layout.addWidget(tbl)
         self.packet_table = tbl
-        self._pm_colors = [row[0] for row in rows]
+        self._pm_row_cache = [None] * len(rows)   # last (hex, field, raw, decoded) per row
+        self._pm_key       = None                 # (raw bytes, lock, scales) last rendered
 
     def _build_jitter_tab(self, parent: QWidget):
         outer = QVBoxLayout(parent)
@@ -492,7 +534,7 @@ class FreeDDashboard(QMainWindow):
         banner_layout.setSpacing(16)
 
         self._jitter_health_dot = QLabel('●')
-        self._jitter_health_dot.setFont(QFont(_FONT_SANS, 18, QFont.Weight.Bold))
+        self._jitter_health_dot.setFont(_font(_FONT_SANS, 18, bold=True))
         self._jitter_health_dot.setStyleSheet(f'color: {self.DIM}; background: transparent;')
         banner_layout.addWidget(self._jitter_health_dot)
 
@@ -503,12 +545,12 @@ class FreeDDashboard(QMainWindow):
         banner_text_v.setSpacing(1)
 
         self._jitter_health_lbl = QLabel('WAITING FOR DATA')
-        self._jitter_health_lbl.setFont(QFont(_FONT_SANS, 13, QFont.Weight.Bold))
+        self._jitter_health_lbl.setFont(_font(_FONT_SANS, 13, bold=True))
         self._jitter_health_lbl.setStyleSheet(f'color: {self.DIM}; background: transparent;')
         banner_text_v.addWidget(self._jitter_health_lbl)
 
         self._jitter_health_sub = QLabel('Measuring packet timing jitter — how consistently packets arrive')
-        self._jitter_health_sub.setFont(QFont(_FONT_SANS, 9))
+        self._jitter_health_sub.setFont(_font(_FONT_SANS, 9))
         self._jitter_health_sub.setStyleSheet(f'color: {self.DIM}; background: transparent;')
         banner_text_v.addWidget(self._jitter_health_sub)
 
@@ -523,7 +565,7 @@ class FreeDDashboard(QMainWindow):
         for dot, label in [('●', f'Ideal  < 1ms'), ('●', 'Accept  1–3ms'), ('●', 'Problem > 5ms')]:
             color = [self.GREEN, self.YELLOW, self.RED][['●', '●', '●'].index(dot) if False else [0,1,2].pop(0)]
             row = QLabel(f'<span style="color:{color}">●</span>  {label}')
-            row.setFont(QFont(_FONT_SANS, 9))
+            row.setFont(_font(_FONT_SANS, 9))
             row.setStyleSheet('color: #8e8e93; background: transparent;')
             thresh_l.addWidget(row)
         banner_layout.addWidget(thresh_w)
@@ -554,11 +596,11 @@ class FreeDDashboard(QMainWindow):
             vbox.setContentsMargins(10, 8, 10, 10)
             vbox.setSpacing(1)
             lbl_t = QLabel(title)
-            lbl_t.setFont(QFont(_FONT_SANS, 8, QFont.Weight.Bold))
+            lbl_t.setFont(_font(_FONT_SANS, 8, bold=True))
             lbl_t.setStyleSheet(f'color: {self.DIM}; background: transparent;')
             lbl_t.setAlignment(Qt.AlignmentFlag.AlignCenter)
             lbl_v = QLabel('---')
-            lbl_v.setFont(QFont(_FONT_MONO, 13, QFont.Weight.Bold))
+            lbl_v.setFont(_font(_FONT_MONO, 13, bold=True))
             lbl_v.setStyleSheet(f'color: {color}; background: transparent;')
             lbl_v.setAlignment(Qt.AlignmentFlag.AlignCenter)
             vbox.addWidget(lbl_t)
@@ -574,7 +616,7 @@ class FreeDDashboard(QMainWindow):
         pos_outer = QVBoxLayout(pos_frame)
         pos_outer.setContentsMargins(14, 10, 14, 12); pos_outer.setSpacing(6)
         pos_title = QLabel('POSITION NOISE  (std dev over last 500 packets)   ● ideal <0.1mm   ● accept <0.5mm   ● problem >1mm')
-        pos_title.setFont(QFont(_FONT_SANS, 9, QFont.Weight.Bold))
+        pos_title.setFont(_font(_FONT_SANS, 9, bold=True))
         pos_title.setStyleSheet(f'color: {self.DIM}; background: transparent;')
         pos_outer.addWidget(pos_title)
 
@@ -585,15 +627,15 @@ class FreeDDashboard(QMainWindow):
             f = QFrame(); f.setObjectName('card')
             vb = QVBoxLayout(f); vb.setContentsMargins(10,8,10,10); vb.setSpacing(2)
             lt = QLabel(axis)
-            lt.setFont(QFont(_FONT_SANS, 9, QFont.Weight.Bold))
+            lt.setFont(_font(_FONT_SANS, 9, bold=True))
             lt.setStyleSheet(f'color: {self.DIM}; background: transparent;')
             lt.setAlignment(Qt.AlignmentFlag.AlignCenter)
             lv = QLabel('---')
-            lv.setFont(QFont(_FONT_MONO, 14, QFont.Weight.Bold))
+            lv.setFont(_font(_FONT_MONO, 14, bold=True))
             lv.setStyleSheet(f'color: {self.FG}; background: transparent;')
             lv.setAlignment(Qt.AlignmentFlag.AlignCenter)
             ls = QLabel('mm std dev')
-            ls.setFont(QFont(_FONT_SANS, 8))
+            ls.setFont(_font(_FONT_SANS, 8))
             ls.setStyleSheet(f'color: {self.DIM}; background: transparent;')
             ls.setAlignment(Qt.AlignmentFlag.AlignCenter)
             vb.addWidget(lt); vb.addWidget(lv); vb.addWidget(ls)
@@ -607,7 +649,7 @@ class FreeDDashboard(QMainWindow):
         rot_outer = QVBoxLayout(rot_frame)
         rot_outer.setContentsMargins(14, 10, 14, 12); rot_outer.setSpacing(6)
         rot_title = QLabel('ROTATION NOISE  (std dev over last 500 packets)   ● ideal <0.01°   ● accept <0.05°   ● problem >0.1°')
-        rot_title.setFont(QFont(_FONT_SANS, 9, QFont.Weight.Bold))
+        rot_title.setFont(_font(_FONT_SANS, 9, bold=True))
         rot_title.setStyleSheet(f'color: {self.DIM}; background: transparent;')
         rot_outer.addWidget(rot_title)
 
@@ -618,15 +660,15 @@ class FreeDDashboard(QMainWindow):
             f = QFrame(); f.setObjectName('card')
             vb = QVBoxLayout(f); vb.setContentsMargins(10,8,10,10); vb.setSpacing(2)
             lt = QLabel(axis)
-            lt.setFont(QFont(_FONT_SANS, 9, QFont.Weight.Bold))
+            lt.setFont(_font(_FONT_SANS, 9, bold=True))
             lt.setStyleSheet(f'color: {self.DIM}; background: transparent;')
             lt.setAlignment(Qt.AlignmentFlag.AlignCenter)
             lv = QLabel('---')
-            lv.setFont(QFont(_FONT_MONO, 14, QFont.Weight.Bold))
+            lv.setFont(_font(_FONT_MONO, 14, bold=True))
             lv.setStyleSheet(f'color: {self.FG}; background: transparent;')
             lv.setAlignment(Qt.AlignmentFlag.AlignCenter)
             ls = QLabel('° std dev')
-            ls.setFont(QFont(_FONT_SANS, 8))
+            ls.setFont(_font(_FONT_SANS, 8))
             ls.setStyleSheet(f'color: {self.DIM}; background: transparent;')
             ls.setAlignment(Qt.AlignmentFlag.AlignCenter)
             vb.addWidget(lt); vb.addWidget(lv); vb.addWidget(ls)
@@ -854,7 +896,7 @@ class FreeDDashboard(QMainWindow):
         row_layout.setSpacing(10)
 
         port_lbl = QLabel('UDP Port')
-        port_lbl.setFont(QFont(_FONT_SANS, 11))
+        port_lbl.setFont(_font(_FONT_SANS, 11))
         port_lbl.setStyleSheet(f'color: {self.FG}; background: transparent;')
         row_layout.addWidget(port_lbl)
 
@@ -891,7 +933,7 @@ class FreeDDashboard(QMainWindow):
         net_inner.addWidget(row)
 
         self._settings_status = QLabel(f'● Listening on port {self._active_port}')
-        self._settings_status.setFont(QFont(_FONT_SANS, 10))
+        self._settings_status.setFont(_font(_FONT_SANS, 10))
         self._settings_status.setStyleSheet(f'color: {self.GREEN}; background: transparent;')
         net_inner.addWidget(self._settings_status)
 
@@ -921,7 +963,7 @@ class FreeDDashboard(QMainWindow):
         for txt, w in [('IP / Broadcast', 160), ('Port', 85), ('Enable', 50), ('', 30)]:
             lbl = QLabel(txt)
             lbl.setFixedWidth(w)
-            lbl.setFont(QFont(_FONT_SANS, 9))
+            lbl.setFont(_font(_FONT_SANS, 9))
             lbl.setStyleSheet(f'color: {self.DIM}; background: transparent;')
             hdr_l.addWidget(lbl)
         hdr_l.addStretch()
@@ -958,7 +1000,7 @@ class FreeDDashboard(QMainWindow):
         dest_outer.addWidget(add_row_w)
 
         self._fwd_count_lbl = QLabel('Forwarded: 0 pkts')
-        self._fwd_count_lbl.setFont(QFont(_FONT_SANS, 10))
+        self._fwd_count_lbl.setFont(_font(_FONT_SANS, 10))
         self._fwd_count_lbl.setStyleSheet(f'color: {self.DIM}; background: transparent;')
         dest_outer.addWidget(self._fwd_count_lbl)
 
@@ -973,12 +1015,12 @@ class FreeDDashboard(QMainWindow):
         oti_outer.setSpacing(8)
 
         oti_hdr = QLabel('OpenTrackIO Output')
-        oti_hdr.setFont(QFont(_FONT_SANS, 11, QFont.Weight.Bold))
+        oti_hdr.setFont(_font(_FONT_SANS, 11, bold=True))
         oti_hdr.setStyleSheet(f'color: {self.FG}; background: transparent;')
         oti_outer.addWidget(oti_hdr)
 
         oti_sub = QLabel('UDP · JSON · OpenTrackIO v1.0.1 · SMPTE RIS-OSVP')
-        oti_sub.setFont(QFont(_FONT_SANS, 9))
+        oti_sub.setFont(_font(_FONT_SANS, 9))
         oti_sub.setStyleSheet(f'color: {self.DIM}; background: transparent;')
         oti_outer.addWidget(oti_sub)
 
@@ -1058,7 +1100,7 @@ class FreeDDashboard(QMainWindow):
             hl = QHBoxLayout(w); hl.setContentsMargins(0,0,0,0); hl.setSpacing(12)
             lbl = QLabel(label_text)
             lbl.setFixedWidth(140)
-            lbl.setFont(QFont(_FONT_SANS, 11))
+            lbl.setFont(_font(_FONT_SANS, 11))
             lbl.setStyleSheet(f'color: {self.FG}; background: transparent;')
             hl.addWidget(lbl)
             return w, hl
@@ -1122,7 +1164,7 @@ class FreeDDashboard(QMainWindow):
         # Preview
         prev_w, prev_l = _tc_row('Preview')
         self._tc_preview_lbl = QLabel('--:--:--:--')
-        self._tc_preview_lbl.setFont(QFont(_FONT_MONO, 13))
+        self._tc_preview_lbl.setFont(_font(_FONT_MONO, 13))
         self._tc_preview_lbl.setStyleSheet(f'color: {self.CYAN}; background: transparent;')
         prev_l.addWidget(self._tc_preview_lbl)
         prev_l.addStretch()
@@ -1312,7 +1354,8 @@ class FreeDDashboard(QMainWindow):
             pass
 
     def _on_parsed_packet(self, data: dict):
-        """Enrich FreeD data with calibrated lens values then forward to OTI."""
+        """Enrich FreeD data with calibrated lens values, forward to OTI and
+        wake the GUI thread for a redraw (receiver thread)."""
         try:
             r = self.receiver
             if 'zoom' in data:
@@ -1322,6 +1365,11 @@ class FreeDDashboard(QMainWindow):
         except Exception as e:
             print(f'[OTI] lens enrich error: {e}', flush=True)
         self.oti_sender.send(data, self.ltc_reader, self.forwarder.tc_fps)
+        # At most one wake-up in flight: packets arriving before the GUI
+        # catches up are picked up by that redraw via latest_data
+        if not self._update_pending:
+            self._update_pending = True
+            self._packet_ready.emit()
 
     # ------------------------------------------------------------------
     # Receiver (background thread)
@@ -1344,12 +1392,17 @@ class FreeDDashboard(QMainWindow):
                 self.receiver.socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
             except OSError:
                 pass
+            # Larger kernel buffer so bursts survive GUI stalls without drops
+            try:
+                self.receiver.socket.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_RCVBUF, FreeDReceiver.RECV_BUFFER_SIZE)
+            except OSError:
+                pass
             self.receiver.socket.settimeout(1.0)
             self.receiver.socket.bind(('0.0.0.0', port))
             self.receiver.running = True
         except Exception as e:
-            self.lbl_status.setText(f'● ERROR: {e}')
-            self.lbl_status.setStyleSheet(f'color: {self.RED}; background: transparent;')
+            self._set_label(self.lbl_status, f'● ERROR: {e}', self.RED)
             return
 
         self.receiver.on_packet = lambda raw: self.forwarder.forward(raw, self.ltc_reader)
@@ -1360,6 +1413,8 @@ class FreeDDashboard(QMainWindow):
             name='FreeDReceiveLoop',
         )
         self.recv_thread.start()
+        # Show LISTENING now rather than on the next 2 Hz stale-timer tick
+        self._do_update()
 
     def _restart_receiver(self, port: int):
         # Stop existing receiver
@@ -1373,41 +1428,71 @@ class FreeDDashboard(QMainWindow):
             self.recv_thread.join(timeout=2.0)
 
         self._active_port = port
-        self.lbl_port.setText(str(port))
+        self._set_label(self.lbl_port, str(port))
         self._start_receiver(port)
 
     # ------------------------------------------------------------------
-    # Update loop (10 Hz via QTimer)
+    # Update loop (per packet, capped at MIN_REFRESH_S; 2 Hz stale check)
     # ------------------------------------------------------------------
 
+    def _on_packet_ready(self):
+        wait = self._last_refresh + self.MIN_REFRESH_S - time.monotonic()
+        if wait > 0:
+            # Too soon after the last redraw — retry once the interval is up
+            QTimer.singleShot(int(wait * 1000) + 1, self._on_packet_ready)
+            return
+        self._update_pending = False
+        self._do_update()
+
     def _do_update(self):
+        if self.isMinimized() or not self.isVisible():
+            return   # nothing on screen — changeEvent redraws on restore
+        self._last_refresh = time.monotonic()
         try:
             self._update()
         except Exception as e:
             try:
-                self.lbl_status.setText(f'● UI ERR: {str(e)[:40]}')
-                self.lbl_status.setStyleSheet(f'color: {self.RED}; background: transparent;')
+                self._set_label(self.lbl_status, f'● UI ERR: {str(e)[:40]}', self.RED)
             except Exception:
                 pass
-        self._update_fwd_ui()
 
     def _update_fwd_ui(self):
+        if self.isMinimized() or not self.isVisible():
+            return
         try:
-            self._fwd_count_lbl.setText(
-                f'Forwarded: {self.forwarder.packets_forwarded:,} pkts')
-            self._tc_preview_lbl.setText(
-                self.forwarder.current_tc_str(self.ltc_reader))
+            self._set_label(self._fwd_count_lbl,
+                            f'Forwarded: {self.forwarder.packets_forwarded:,} pkts')
+            self._set_label(self._tc_preview_lbl,
+                            self.forwarder.current_tc_str(self.ltc_reader))
         except Exception:
             pass
 
+    def _set_label(self, lbl: QLabel, text: str = None, color: str = None):
+        """setText / colour stylesheet only when they differ from the last call —
+        setStyleSheet re-polishes the widget even if the sheet is unchanged."""
+        if text is not None and self._label_text.get(lbl) != text:
+            self._label_text[lbl] = text
+            lbl.setText(text)
+        if color is not None and self._label_color.get(lbl) != color:
+            self._label_color[lbl] = color
+            lbl.setStyleSheet(f'color: {color}; background: transparent;')
+
+    def _set_field(self, lbl: QLabel, raw: int, value: float, fmt: str, color: str):
+        """_set_label for a label showing fmt.format(value, raw) — the text is
+        only formatted when the raw wire value differs from the one on screen."""
+        if self._label_raw.get(lbl) != raw:
+            self._label_raw[lbl] = raw
+            self._set_label(lbl, fmt.format(value, raw), color)
+        else:
+            self._set_label(lbl, color=color)
+
     def _update(self):
         if self.receiver is None:
             return
 
         if self.recv_thread is not None and not self.recv_thread.is_alive():
             err = self.receiver._last_error or 'unknown error'
-            self.lbl_status.setText(f'● RX DEAD: {err[:40]}')
-            self.lbl_status.setStyleSheet(f'color: {self.RED}; background: transparent;')
+            self._set_label(self.lbl_status, f'● RX DEAD: {err[:40]}', self.RED)
             return
 
         data = self.receiver.latest_data
@@ -1424,57 +1509,60 @@ class FreeDDashboard(QMainWindow):
                     self._cached_ip_str = '  /  '.join(all_ips) if all_ips else '0.0.0.0'
                 except Exception:
                     self._cached_ip_str = '0.0.0.0'
-            self.lbl_status.setText(f'● LISTENING :{self._active_port}  [{self._cached_ip_str}]')
-            self.lbl_status.setStyleSheet(f'color: {self.CYAN}; background: transparent;')
+            self._set_label(self.lbl_status, f'● LISTENING :{self._active_port}  [{self._cached_ip_str}]', self.CYAN)
             return
 
         r = self.receiver
         now = time.monotonic()
         is_stale = (r._last_packet_time is not None) and ((now - r._last_packet_time) > 2.0)
 
+        # Nothing to redraw until a new packet lands or the stream goes stale /
+        # recovers — an idle or stalled source costs one identity check per tick
+        if data is self._drawn_data and is_stale == self._drawn_stale:
+            return
+
+        # Read every field out of the packet dict once
+        pan, tilt, roll = data['pan'], data['tilt'], data['roll']
+        pos  = data['position']
+        px, py, pz = pos['x'], pos['y'], pos['z']
+        zoom, focus = data['zoom'], data['focus']
+        rb   = data['raw_bytes']
+        rs   = r.rotation_scale
+        ps   = r.position_scale
+
         # Rotation
-        pan_deg  = data['pan']  * r.rotation_scale
-        tilt_deg = data['tilt'] * r.rotation_scale
-        roll_deg = data['roll'] * r.rotation_scale
+        pan_deg  = pan  * rs
+        tilt_deg = tilt * rs
+        roll_deg = roll * rs
         rot_color = self.DIM if is_stale else self.GREEN
-        self.lbl_pan.setText(f'{pan_deg:+8.2f}°  [{data["pan"]}]')
-        self.lbl_pan.setStyleSheet(f'color: {rot_color}; background: transparent;')
-        self.lbl_tilt.setText(f'{tilt_deg:+8.2f}°  [{data["tilt"]}]')
-        self.lbl_tilt.setStyleSheet(f'color: {rot_color}; background: transparent;')
-        self.lbl_roll.setText(f'{roll_deg:+8.2f}°  [{data["roll"]}]')
-        self.lbl_roll.setStyleSheet(f'color: {rot_color}; background: transparent;')
+        self._set_field(self.lbl_pan,  pan,  pan_deg,  '{:+8.2f}°  [{}]', rot_color)
+        self._set_field(self.lbl_tilt, tilt, tilt_deg, '{:+8.2f}°  [{}]', rot_color)
+        self._set_field(self.lbl_roll, roll, roll_deg, '{:+8.2f}°  [{}]', rot_color)
 
         # Position
-        x_m = data['position']['x'] * r.position_scale / 1000.0
-        y_m = data['position']['y'] * r.position_scale / 1000.0
-        z_m = data['position']['z'] * r.position_scale / 1000.0
+        x_m = px * ps / 1000.0
+        y_m = py * ps / 1000.0
+        z_m = pz * ps / 1000.0
         pos_color = self.DIM if is_stale else self.CYAN
-        self.lbl_x.setText(f'{x_m:+7.3f} m  [{data["position"]["x"]}]')
-        self.lbl_x.setStyleSheet(f'color: {pos_color}; background: transparent;')
-        self.lbl_y.setText(f'{y_m:+7.3f} m  [{data["position"]["y"]}]')
-        self.lbl_y.setStyleSheet(f'color: {pos_color}; background: transparent;')
-        self.lbl_z.setText(f'{z_m:+7.3f} m  [{data["position"]["z"]}]')
-        self.lbl_z.setStyleSheet(f'color: {pos_color}; background: transparent;')
+        self._set_field(self.lbl_x, px, x_m, '{:+7.3f} m  [{}]', pos_color)
+        self._set_field(self.lbl_y, py, y_m, '{:+7.3f} m  [{}]', pos_color)
+        self._set_field(self.lbl_z, pz, z_m, '{:+7.3f} m  [{}]', pos_color)
 
         # Lens
-        focal_length   = data['zoom']  / 1000.0 if data['zoom'] != 0 else None
-        focus_distance = abs(data['focus'] / 1000.0) if data['focus'] not in (0, 65535) else None
+        focal_length   = zoom / 1000.0 if zoom != 0 else None
+        focus_distance = abs(focus / 1000.0) if focus not in (0, 65535) else None
         total_inches   = focus_distance * 39.3701 if focus_distance is not None else 0.0
         feet           = int(total_inches // 12)
         frac_in        = total_inches % 12
         lens_color = self.DIM if is_stale else self.YELLOW
         if focal_length is None:
-            self.lbl_zoom.setText(f'---  [{data["zoom"]}]')
-            self.lbl_zoom.setStyleSheet(f'color: {self.DIM}; background: transparent;')
+            self._set_label(self.lbl_zoom, f'---  [{zoom}]', self.DIM)
         else:
-            self.lbl_zoom.setText(f'{focal_length:.1f} mm  [{data["zoom"]}]')
-            self.lbl_zoom.setStyleSheet(f'color: {lens_color}; background: transparent;')
+            self._set_label(self.lbl_zoom, f'{focal_length:.1f} mm  [{zoom}]', lens_color)
         if focus_distance is None:
-            self.lbl_focus.setText(f'---  [{data["focus"]}]')
-            self.lbl_focus.setStyleSheet(f'color: {self.DIM}; background: transparent;')
+            self._set_label(self.lbl_focus, f'---  [{focus}]', self.DIM)
         else:
-            self.lbl_focus.setText(f'{focus_distance:.2f}m  {feet}ft {frac_in:.1f}in  [{data["focus"]}]')
-            self.lbl_focus.setStyleSheet(f'color: {lens_color}; background: transparent;')
+            self._set_label(self.lbl_focus, f'{focus_distance:.2f}m  {feet}ft {frac_in:.1f}in  [{focus}]', lens_color)
 
         # Timecode — prefer extended block (bytes 29–32) for full H:M:S:F
         ext = data.get('ext_tc')
@@ -1482,126 +1570,128 @@ class FreeDDashboard(QMainWindow):
             tc = f'{ext[0]:02d}:{ext[1]:02d}:{ext[2]:02d}:{ext[3]:02d}'
         else:
             tc = r.parse_timecode(data['spare'], 1.0)
-        self.lbl_tc.setText(tc or '--:--:--:--')
+        self._set_label(self.lbl_tc, tc or '--:--:--:--')
 
         # Stats
-        self.lbl_packets.setText(f"{r.parser.packet_count:,}")
-        self.lbl_cam.setText(f"CAM {data['camera_id']}")
+        self._set_label(self.lbl_packets, f"{r.parser.packet_count:,}")
+        self._set_label(self.lbl_cam, f"CAM {data['camera_id']}")
         if addr:
-            self.lbl_source.setText(f'{addr[0]}:{addr[1]}')
+            self._set_label(self.lbl_source, f'{addr[0]}:{addr[1]}')
         if is_stale:
-            self.lbl_status.setText('● TIMEOUT')
-            self.lbl_status.setStyleSheet(f'color: {self.RED}; background: transparent;')
+            self._set_label(self.lbl_status, '● TIMEOUT', self.RED)
         else:
-            self.lbl_status.setText('● LIVE')
-            self.lbl_status.setStyleSheet(f'color: {self.GREEN}; background: transparent;')
+            self._set_label(self.lbl_status, '● LIVE', self.GREEN)
 
         if r.packet_interval_ms is not None:
             fps = r.packet_fps
-            self.lbl_interval.setText(f'{r.packet_interval_ms:.1f} ms  ({fps:.1f} fps)')
+            self._set_label(self.lbl_interval, f'{r.packet_interval_ms:.1f} ms  ({fps:.1f} fps)')
 
         # Raw packet
         msg_type   = data['message_type']
         proto_name = f'D{msg_type & 0x0F}  (0x{msg_type:02X})'
-        self.lbl_proto.setText(proto_name)
-        self.lbl_rawsize.setText(f"{data['packet_size']} bytes")
-        raw = data['raw_bytes']
-        mid   = len(raw) // 2
-        line1 = ' '.join(f'{b:02X}' for b in raw[:mid])
-        line2 = ' '.join(f'{b:02X}' for b in raw[mid:])
-        self.lbl_hex1.setText(line1)
-        self.lbl_hex2.setText(line2)
+        self._set_label(self.lbl_proto, proto_name)
+        self._set_label(self.lbl_rawsize, f"{data['packet_size']} bytes")
+        # One C-level hex dump per tick; byte i is hx[3*i : 3*i+2], so every
+        # hex field below is a plain string slice
+        hx    = rb.hex(' ').upper()
+        mid   = len(rb) // 2
+        line1 = hx[:3 * mid - 1]
+        line2 = hx[3 * mid:]
+        self._set_label(self.lbl_hex1, line1)
+        self._set_label(self.lbl_hex2, line2)
 
         # Genlock
-        rb        = data['raw_bytes']
         gl_byte26 = rb[26]
         gl_byte27 = rb[27]
         gl_phase  = (gl_byte26 >> 4) & 0xF
+        is_locked = len(set(r._gl_phase_history)) > 1   # shared with the map/jitter pages
         if is_stale:
-            self.lbl_gl_status.setText('● NO SIGNAL')
-            self.lbl_gl_status.setStyleSheet(f'color: {self.RED}; background: transparent;')
-            self.lbl_gl_phase.setText('---')
-            self.lbl_gl_freq.setText('--- Hz')
-            self.lbl_gl_raw.setText('-- --')
+            self._set_label(self.lbl_gl_status, '● NO SIGNAL', self.RED)
+            self._set_label(self.lbl_gl_phase, '---')
+            self._set_label(self.lbl_gl_freq, '--- Hz')
+            self._set_label(self.lbl_gl_raw, '-- --')
         else:
-            is_locked = len(set(r._gl_phase_history)) > 1
-            self.lbl_gl_status.setText('● LOCKED' if is_locked else '● UNLOCKED')
-            self.lbl_gl_status.setStyleSheet(
-                f'color: {self.GREEN if is_locked else self.RED}; background: transparent;')
-            self.lbl_gl_phase.setText(f'{gl_phase:X}h  ({gl_phase}/16)')
+            self._set_label(self.lbl_gl_status, '● LOCKED' if is_locked else '● UNLOCKED',
+                            self.GREEN if is_locked else self.RED)
+            self._set_label(self.lbl_gl_phase, f'{gl_phase:X}h  ({gl_phase}/16)')
             if r.packet_fps is not None:
-                self.lbl_gl_freq.setText(f'{r.packet_fps:.2f} Hz')
-            self.lbl_gl_raw.setText(f'0x{gl_byte26:02X} 0x{gl_byte27:02X}  [{gl_byte26:08b}]')
-        self.lbl_gl_ref.setText(f'0x{gl_byte27:02X} (vendor-defined)')
-
-        # Packet Map
-        if hasattr(self, 'packet_table'):
-            rb          = data['raw_bytes']
-            gl_phase_pm = (rb[26] >> 4) & 0xF
-            lock_str    = 'LOCKED' if len(set(r._gl_phase_history)) > 1 else 'UNLOCKED'
-            map_rows = [
-                (f'{rb[0]:02X}',
-                 'Msg Type', str(rb[0]),
-                 f'D{rb[0] & 0x0F} Protocol'),
-                (f'{rb[1]:02X}',
-                 'Cam ID', str(rb[1]),
-                 f'Camera {rb[1]}'),
-                (' '.join(f'{b:02X}' for b in rb[2:5]),
-                 'Pan', str(data['pan']),
-                 f'{pan_deg:+.2f}°'),
-                (' '.join(f'{b:02X}' for b in rb[5:8]),
-                 'Tilt', str(data['tilt']),
-                 f'{tilt_deg:+.2f}°'),
-                (' '.join(f'{b:02X}' for b in rb[8:11]),
-                 'Roll', str(data['roll']),
-                 f'{roll_deg:+.2f}°'),
-                (' '.join(f'{b:02X}' for b in rb[11:14]),
-                 'X', str(data['position']['x']),
-                 f'{x_m:+.3f} m'),
-                (' '.join(f'{b:02X}' for b in rb[14:17]),
-                 'Y', str(data['position']['y']),
-                 f'{y_m:+.3f} m'),
-                (' '.join(f'{b:02X}' for b in rb[17:20]),
-                 'Z', str(data['position']['z']),
-                 f'{z_m:+.3f} m'),
-                (' '.join(f'{b:02X}' for b in rb[20:23]),
-                 'Zoom', str(data['zoom']),
-                 f'{focal_length:.1f} mm' if focal_length is not None else '---'),
-                (' '.join(f'{b:02X}' for b in rb[23:26]),
-                 'Focus', str(data['focus']),
-                 f'{focus_distance:.2f}m  {feet}ft {frac_in:.1f}in' if focus_distance is not None else '---'),
-                (f'{rb[26]:02X} {rb[27]:02X}',
-                 'Spare/GL', f'0x{data["spare"]:04X}',
-                 f'{lock_str}  ph={gl_phase_pm:X}h  ref=0x{rb[27]:02X}'),
-                (f'{rb[28]:02X}',
-                 'Checksum', f'0x{rb[28]:02X}',
-                 'OK' if data['checksum_valid'] else 'MISMATCH'),
-            ]
-            mono = self._pm_font
-            for i, (hx, field, raw_val, decoded) in enumerate(map_rows):
-                qc = QColor(self._pm_colors[i])
-                for col, text in enumerate([hx, field, raw_val, decoded]):
-                    item = self.packet_table.item(i, col)
-                    if item is None:
-                        item = QTableWidgetItem(text)
-                        item.setFont(mono)
-                        self.packet_table.setItem(i, col, item)
-                    else:
-                        item.setText(text)
-                    item.setForeground(qc)
-
-        # Jitter tab
-        if hasattr(self, '_jitter_stat_labels'):
-            self._update_jitter_tab()
-
-    def _update_jitter_tab(self):
+                self._set_label(self.lbl_gl_freq, f'{r.packet_fps:.2f} Hz')
+            self._set_label(self.lbl_gl_raw, f'0x{gl_byte26:02X} 0x{gl_byte27:02X}  [{gl_byte26:08b}]')
+        self._set_label(self.lbl_gl_ref, f'0x{gl_byte27:02X} (vendor-defined)')
+
+        # Packet Map / Jitter pages — only the one on screen is rendered
+        page = self._tabs.currentWidget()
+        if page is self._pmap_page:
+            lock_str    = 'LOCKED' if is_locked else 'UNLOCKED'
+            # Every row is a function of the raw bytes, the lock state and the
+            # scales — a static camera repeats them, so skip building all 12 rows
+            pm_key = (rb, lock_str, rs, ps)
+            if pm_key != self._pm_key:
+                self._pm_key = pm_key
+                map_rows = [
+                    (hx[0:2],
+                     'Msg Type', str(rb[0]),
+                     f'D{rb[0] & 0x0F} Protocol'),
+                    (hx[3:5],
+                     'Cam ID', str(rb[1]),
+                     f'Camera {rb[1]}'),
+                    (hx[6:14],
+                     'Pan', str(pan),
+                     f'{pan_deg:+.2f}°'),
+                    (hx[15:23],
+                     'Tilt', str(tilt),
+                     f'{tilt_deg:+.2f}°'),
+                    (hx[24:32],
+                     'Roll', str(roll),
+                     f'{roll_deg:+.2f}°'),
+                    (hx[33:41],
+                     'X', str(px),
+                     f'{x_m:+.3f} m'),
+                    (hx[42:50],
+                     'Y', str(py),
+                     f'{y_m:+.3f} m'),
+                    (hx[51:59],
+                     'Z', str(pz),
+                     f'{z_m:+.3f} m'),
+                    (hx[60:68],
+                     'Zoom', str(zoom),
+                     f'{focal_length:.1f} mm' if focal_length is not None else '---'),
+                    (hx[69:77],
+                     'Focus', str(focus),
+                     f'{focus_distance:.2f}m  {feet}ft {frac_in:.1f}in' if focus_distance is not None else '---'),
+                    (hx[78:83],
+                     'Spare/GL', f'0x{data["spare"]:04X}',
+                     f'{lock_str}  ph={gl_phase:X}h  ref=0x{gl_byte27:02X}'),
+                    (hx[84:86],
+                     'Checksum', f'0x{rb[28]:02X}',
+                     'OK' if data['checksum_valid'] else 'MISMATCH'),
+                ]
+                table = self.packet_table
+                row_cache = self._pm_row_cache
+                for i, row in enumerate(map_rows):
+                    prev = row_cache[i]
+                    if prev == row:
+                        continue   # unchanged since last tick — skip 4 item updates
+                    row_cache[i] = row
+                    for col, text in enumerate(row):
+                        if prev is not None and prev[col] == text:
+                            continue   # only touch the cells whose text changed
+                        # Items, fonts and row colours are fixed in _build_packet_map
+                        table.item(i, col).setText(text)
+        elif page is self._jitter_page:
+            self._update_jitter_tab(is_locked)
+
+        self._drawn_data  = data
+        self._drawn_stale = is_stale
+
+    def _update_jitter_tab(self, is_locked: bool):
         r       = self.receiver
         history = list(r._jitter_history)
         n       = len(history)
 
         if n < 2:
             for lbl in self._jitter_stat_labels.values():
-                lbl.setText('---')
+                self._set_label(lbl, '---')
             return
 
         arr  = np.array(history, dtype=np.float64)
@@ -1612,16 +1702,14 @@ class FreeDDashboard(QMainWindow):
         peak = max(abs(mx - mean), abs(mn - mean))
         rfc  = r._rfc_jitter
 
-        self._jitter_stat_labels['MEAN'].setText(f'{mean:.2f} ms')
-        self._jitter_stat_labels['STD DEV'].setText(f'{std:.2f} ms')
-        self._jitter_stat_labels['MIN'].setText(f'{mn:.1f} ms')
-        self._jitter_stat_labels['MAX'].setText(f'{mx:.1f} ms')
-        self._jitter_stat_labels['PEAK  ±'].setText(f'±{peak:.2f} ms')
-        self._jitter_stat_labels['RFC JITTER'].setText(f'{rfc:.2f} ms')
+        self._set_label(self._jitter_stat_labels['MEAN'], f'{mean:.2f} ms')
+        self._set_label(self._jitter_stat_labels['STD DEV'], f'{std:.2f} ms')
+        self._set_label(self._jitter_stat_labels['MIN'], f'{mn:.1f} ms')
+        self._set_label(self._jitter_stat_labels['MAX'], f'{mx:.1f} ms')
+        self._set_label(self._jitter_stat_labels['PEAK  ±'], f'±{peak:.2f} ms')
+        self._set_label(self._jitter_stat_labels['RFC JITTER'], f'{rfc:.2f} ms')
 
         # Health assessment based on RFC jitter and genlock state
-        is_locked = len(set(r._gl_phase_history)) > 1
-
         if is_locked:
             # Genlocked: frame alignment is handled by sync signal — timing jitter is far less critical
             if rfc < 5.0:
@@ -1655,22 +1743,19 @@ class FreeDDashboard(QMainWindow):
                 health_title = 'PROBLEMATIC  ·  NOT GENLOCKED'
                 health_sub   = f'RFC jitter {rfc:.2f} ms — visible judder likely on LED wall, fix network or add genlock'
 
-        self._jitter_health_dot.setStyleSheet(f'color: {health_color}; background: transparent;')
-        self._jitter_health_lbl.setText(health_title)
-        self._jitter_health_lbl.setStyleSheet(f'color: {health_color}; background: transparent;')
-        self._jitter_health_sub.setText(health_sub)
+        self._set_label(self._jitter_health_dot, color=health_color)
+        self._set_label(self._jitter_health_lbl, health_title, health_color)
+        self._set_label(self._jitter_health_sub, health_sub)
 
         # Color RFC JITTER stat card dynamically
-        self._jitter_stat_labels['RFC JITTER'].setStyleSheet(
-            f'color: {health_color}; background: transparent;')
+        self._set_label(self._jitter_stat_labels['RFC JITTER'], color=health_color)
 
         # ── Position noise ─────────────────────────────────────────────
         pos_scale_mm = r.position_scale   # 1/64 → mm
         for axis, hist in (('X', r._x_history), ('Y', r._y_history), ('Z', r._z_history)):
             lbl = self._noise_pos_labels[axis]
             if len(hist) < 10:
-                lbl.setText('…')
-                lbl.setStyleSheet(f'color: {self.DIM}; background: transparent;')
+                self._set_label(lbl, '…', self.DIM)
                 continue
             std_mm = float(np.std(np.array(hist, dtype=np.float64))) * pos_scale_mm
             if std_mm < 0.1:
@@ -1679,16 +1764,14 @@ class FreeDDashboard(QMainWindow):
                 c = self.YELLOW
             else:
                 c = self.RED
-            lbl.setText(f'{std_mm:.5f}')
-            lbl.setStyleSheet(f'color: {c}; background: transparent;')
+            self._set_label(lbl, f'{std_mm:.5f}', c)
 
         # ── Rotation noise ─────────────────────────────────────────────
         rot_scale = r.rotation_scale   # 1/32768 → degrees
         for axis, hist in (('Pan', r._pan_history), ('Tilt', r._tilt_history), ('Roll', r._roll_history)):
             lbl = self._noise_rot_labels[axis]
             if len(hist) < 10:
-                lbl.setText('…')
-                lbl.setStyleSheet(f'color: {self.DIM}; background: transparent;')
+                self._set_label(lbl, '…', self.DIM)
                 continue
             std_deg = float(np.std(np.array(hist, dtype=np.float64))) * rot_scale
             if std_deg < 0.01:
@@ -1697,14 +1780,27 @@ class FreeDDashboard(QMainWindow):
                 c = self.YELLOW
             else:
                 c = self.RED
-            lbl.setText(f'{std_deg:.6f}')
-            lbl.setStyleSheet(f'color: {c}; background: transparent;')
+            self._set_label(lbl, f'{std_deg:.6f}', c)
 
     # ------------------------------------------------------------------
     # Close
     # ------------------------------------------------------------------
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        # _start_receiver() runs before the first show, when redraws are skipped
+        self._do_update()
+        self._update_fwd_ui()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        # Catch up at once when restored; labels were left as-is while minimized
+        if event.type() == QEvent.Type.WindowStateChange and not self.isMinimized():
+            self._do_update()
+            self._update_fwd_ui()
+
     def closeEvent(self, event):
+        self._stale_timer.stop()
         self._timer.stop()
         self.ltc_reader.stop()
         self.forwarder.save_config()
@@ -8,11 +8,12 @@ Author  : Libor Cevelik
 Copyright (c) 2026 Libor Cevelik. All rights reserved.
 """
 
+import ctypes
 import os
 import socket
-import struct
 import sys
 import threading
+import time
 
 # Allow running from project root or simulators/ subfolder
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -23,21 +24,24 @@ from PyQt6.QtWidgets import (
     QSlider, QSpinBox, QDoubleSpinBox, QCheckBox, QPushButton,
     QGroupBox, QSizePolicy,
 )
-from PyQt6.QtCore import QTimer, Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt
 
+from src.protocol import FREED_STRUCT as _FREED_STRUCT, raise_thread_priority
 from src.ui_utils import FONT_MONO as _FONT_MONO, FONT_SANS as _FONT_SANS, configure_stdout
 configure_stdout()
 
 
 # ── FreeD Packet Builder ───────────────────────────────────────────────────
 
-def _pack_24bit_signed(value: int) -> bytes:
-    """Pack a signed integer into 3 bytes big-endian."""
+# The packet is written by one pack() into FreeDParser's own D1 layout
+# (src.protocol.FREED_STRUCT): each signed 24-bit field is a signed high byte
+# plus the unsigned low 16 bits, then the spare word and the checksum byte.
+
+
+def _split_24bit_signed(value: int) -> tuple:
+    """Clamp to the signed 24-bit range; return (high byte, low 16 bits)."""
     value = max(-8388608, min(8388607, value))
-    if value < 0:
-        value += 0x1000000
-    return bytes([(value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF])
+    return value >> 16, value & 0xFFFF
 
 
 def build_freed_packet(
@@ -58,28 +62,23 @@ def build_freed_packet(
     zoom_raw  = 0 if zoom_no_data else max(0, int(zoom_mm * 1000))
     focus_raw = 65535 if focus_no_data else max(0, int(focus_m * 1000))
 
-    pkt = bytearray(29)
-    pkt[0]  = 0xD1
-    pkt[1]  = camera_id & 0xFF
-    pkt[2:5]   = _pack_24bit_signed(pan_raw)
-    pkt[5:8]   = _pack_24bit_signed(tilt_raw)
-    pkt[8:11]  = _pack_24bit_signed(roll_raw)
-    pkt[11:14] = _pack_24bit_signed(x_raw)
-    pkt[14:17] = _pack_24bit_signed(y_raw)
-    pkt[17:20] = _pack_24bit_signed(z_raw)
-    pkt[20:23] = _pack_24bit_signed(zoom_raw)
-    pkt[23:26] = _pack_24bit_signed(focus_raw)
-
-    if genlock_on:
-        pkt[26] = (phase_counter & 0x0F) << 4
-    else:
-        pkt[26] = 0x00
-    pkt[27] = 0x00
-
+    byte26 = (phase_counter & 0x0F) << 4 if genlock_on else 0x00
+    byte27 = 0x00
     # Device checksum: (byte26 + byte27 + byte28) & 0xFF == 0xF6
-    pkt[28] = (0xF6 - pkt[26] - pkt[27]) & 0xFF
-
-    return bytes(pkt)
+    byte28 = (0xF6 - byte26 - byte27) & 0xFF
+
+    return _FREED_STRUCT.pack(
+        0xD1, camera_id & 0xFF,
+        *_split_24bit_signed(pan_raw),
+        *_split_24bit_signed(tilt_raw),
+        *_split_24bit_signed(roll_raw),
+        *_split_24bit_signed(x_raw),
+        *_split_24bit_signed(y_raw),
+        *_split_24bit_signed(z_raw),
+        *_split_24bit_signed(zoom_raw),
+        *_split_24bit_signed(focus_raw),
+        (byte26 << 8) | byte27, byte28,
+    )
 
 
 # ── Simulator GUI ──────────────────────────────────────────────────────────
@@ -101,16 +100,33 @@ class FreeDSimulator(QMainWindow):
     TARGET_HOST = '127.0.0.1'
     TARGET_PORT = 45000
 
+    # SO_SNDBUF request — head-room so a scheduling hiccup in the sender
+    # thread never makes send() block.  Linux caps it at net.core.wmem_max.
+    SEND_BUFFER_SIZE = 2 * 1024 * 1024
+
     def __init__(self):
         super().__init__()
         self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SEND_BUFFER_SIZE)
+        except OSError:
+            pass
+        # Fixed destination: connect once so each send skips address handling
+        self._sock.connect((self.TARGET_HOST, self.TARGET_PORT))
         self._phase = 0
         self._sending = False
+        # Packet template: fields are re-packed on the GUI thread only when a
+        # control changes; each send copies it and patches phase + checksum
+        self._template     = bytes(29)
+        self._pkt_buf      = bytearray(29)
+        self._buf_template = None   # template currently copied into _pkt_buf
+        self._genlock_on   = True   # snapshot of the checkbox for the sender thread
 
-        self._build_ui()
+        self._send_thread = None
+        self._send_stop   = threading.Event()
 
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._send_packet)
+        self._build_ui()
+        self._rebuild_template()
 
     # ── Stylesheet ─────────────────────────────────────────────────────────
 
@@ -254,6 +270,15 @@ class FreeDSimulator(QMainWindow):
             font-family: '{_FONT_MONO}';
             font-size: 12px;
         }}
+        QDoubleSpinBox#rotation {{
+            color: {self.GREEN};
+        }}
+        QDoubleSpinBox#position {{
+            color: {self.CYAN};
+        }}
+        QDoubleSpinBox#lens {{
+            color: {self.YELLOW};
+        }}
         """
 
     # ── UI Construction ────────────────────────────────────────────────────
@@ -298,7 +323,7 @@ class FreeDSimulator(QMainWindow):
 
     def _make_slider_row(self, label: str, min_v: float, max_v: float,
                          step: float, default: float, unit: str,
-                         color: str) -> tuple:
+                         accent: str) -> tuple:
         """Returns (widget_row QWidget, spinbox QDoubleSpinBox, slider QSlider)."""
         row = QWidget()
         lay = QHBoxLayout(row)
@@ -324,7 +349,7 @@ class FreeDSimulator(QMainWindow):
         spin.setValue(default)
         spin.setSuffix(f' {unit}')
         spin.setFixedWidth(110)
-        spin.setStyleSheet(f'QDoubleSpinBox {{ color: {color}; }}')
+        spin.setObjectName(accent)   # value colour comes from the window stylesheet
         lay.addWidget(spin)
 
         # Sync slider ↔ spinbox
@@ -340,6 +365,10 @@ class FreeDSimulator(QMainWindow):
 
         sl.valueChanged.connect(sl_changed)
         spin.valueChanged.connect(spin_changed)
+        # Connected after the sync handlers, so the spinbox already holds
+        # the new value; the slider path has the spinbox signals blocked
+        sl.valueChanged.connect(self._rebuild_template)
+        spin.valueChanged.connect(self._rebuild_template)
 
         return row, spin, sl
 
@@ -356,11 +385,11 @@ class FreeDSimulator(QMainWindow):
         gb, lay = self._group_box('Rotation')
 
         row_pan, self._spin_pan, _ = self._make_slider_row(
-            'Pan', -180.0, 180.0, 0.1, 0.0, '°', self.GREEN)
+            'Pan', -180.0, 180.0, 0.1, 0.0, '°', 'rotation')
         row_tilt, self._spin_tilt, _ = self._make_slider_row(
-            'Tilt', -90.0, 90.0, 0.1, 0.0, '°', self.GREEN)
+            'Tilt', -90.0, 90.0, 0.1, 0.0, '°', 'rotation')
         row_roll, self._spin_roll, _ = self._make_slider_row(
-            'Roll', -180.0, 180.0, 0.1, 0.0, '°', self.GREEN)
+            'Roll', -180.0, 180.0, 0.1, 0.0, '°', 'rotation')
 
         lay.addWidget(row_pan)
         lay.addWidget(row_tilt)
@@ -373,11 +402,11 @@ class FreeDSimulator(QMainWindow):
         gb, lay = self._group_box('Position')
 
         row_x, self._spin_x, _ = self._make_slider_row(
-            'X', -50.0, 50.0, 0.01, 0.0, 'm', self.CYAN)
+            'X', -50.0, 50.0, 0.01, 0.0, 'm', 'position')
         row_y, self._spin_y, _ = self._make_slider_row(
-            'Y', -50.0, 50.0, 0.01, 0.0, 'm', self.CYAN)
+            'Y', -50.0, 50.0, 0.01, 0.0, 'm', 'position')
         row_z, self._spin_z, _ = self._make_slider_row(
-            'Z', -50.0, 50.0, 0.01, 0.0, 'm', self.CYAN)
+            'Z', -50.0, 50.0, 0.01, 0.0, 'm', 'position')
 
         lay.addWidget(row_x)
         lay.addWidget(row_y)
@@ -391,10 +420,11 @@ class FreeDSimulator(QMainWindow):
 
         self._chk_zoom_nodata = QCheckBox('No data (raw = 0)')
         self._chk_zoom_nodata.stateChanged.connect(self._on_zoom_nodata)
+        self._chk_zoom_nodata.stateChanged.connect(self._rebuild_template)
         lay.addWidget(self._chk_zoom_nodata)
 
         row_zoom, self._spin_zoom, self._sl_zoom = self._make_slider_row(
-            'mm', 1.0, 300.0, 0.1, 24.0, 'mm', self.YELLOW)
+            'mm', 1.0, 300.0, 0.1, 24.0, 'mm', 'lens')
         lay.addWidget(row_zoom)
         return gb
 
@@ -411,10 +441,11 @@ class FreeDSimulator(QMainWindow):
         self._chk_focus_nodata = QCheckBox('No data (raw = 65535)')
         self._chk_focus_nodata.setChecked(True)
         self._chk_focus_nodata.stateChanged.connect(self._on_focus_nodata)
+        self._chk_focus_nodata.stateChanged.connect(self._rebuild_template)
         lay.addWidget(self._chk_focus_nodata)
 
         row_focus, self._spin_focus, self._sl_focus = self._make_slider_row(
-            'm', 0.1, 100.0, 0.01, 1.5, 'm', self.YELLOW)
+            'm', 0.1, 100.0, 0.01, 1.5, 'm', 'lens')
         self._spin_focus.setEnabled(False)
         self._sl_focus.setEnabled(False)
         lay.addWidget(row_focus)
@@ -432,6 +463,7 @@ class FreeDSimulator(QMainWindow):
 
         self._chk_genlock = QCheckBox('Genlock ON  (cycles phase counter)')
         self._chk_genlock.setChecked(True)
+        self._chk_genlock.toggled.connect(self._on_genlock)
         lay.addWidget(self._chk_genlock)
 
         info = QLabel('Phase counter increments each packet\nwhen ON, stays 0x0 when OFF')
@@ -453,6 +485,7 @@ class FreeDSimulator(QMainWindow):
         self._spin_cam_id.setRange(0, 255)
         self._spin_cam_id.setValue(1)
         self._spin_cam_id.setFixedWidth(110)
+        self._spin_cam_id.valueChanged.connect(self._rebuild_template)
 
         self._spin_fps = QSpinBox()
         self._spin_fps.setRange(1, 60)
@@ -500,9 +533,9 @@ class FreeDSimulator(QMainWindow):
 
     # ── Packet building & sending ──────────────────────────────────────────
 
-    def _current_packet(self) -> bytes:
-        self._phase = (self._phase + 1) & 0x0F if self._chk_genlock.isChecked() else 0
-        return build_freed_packet(
+    def _rebuild_template(self, *_):
+        """Re-pack the field bytes from the controls (GUI thread only)."""
+        self._template = build_freed_packet(
             camera_id    = self._spin_cam_id.value(),
             pan_deg      = self._spin_pan.value(),
             tilt_deg     = self._spin_tilt.value(),
@@ -514,22 +547,76 @@ class FreeDSimulator(QMainWindow):
             zoom_no_data = self._chk_zoom_nodata.isChecked(),
             focus_m      = self._spin_focus.value(),
             focus_no_data= self._chk_focus_nodata.isChecked(),
-            genlock_on   = self._chk_genlock.isChecked(),
-            phase_counter= self._phase,
+            genlock_on   = False,
+            phase_counter= 0,
         )
 
+    def _on_genlock(self, checked: bool):
+        self._genlock_on = checked
+
+    def _current_packet(self) -> bytearray:
+        """Next packet, patched in place — valid until the following call."""
+        self._phase = (self._phase + 1) & 0x0F if self._genlock_on else 0
+        buf = self._pkt_buf
+        tpl = self._template   # rebound atomically by the GUI thread
+        if tpl is not self._buf_template:
+            buf[:] = tpl
+            self._buf_template = tpl
+        # Phase counter (upper nibble of byte 26) stays 0 while genlock is off
+        buf[26] = self._phase << 4
+        # Device checksum: (byte26 + byte27 + byte28) & 0xFF == 0xF6
+        buf[28] = (0xF6 - buf[26] - buf[27]) & 0xFF
+        return buf
+
     def _send_one(self):
         pkt = self._current_packet()
-        self._sock.sendto(pkt, (self.TARGET_HOST, self.TARGET_PORT))
-
-    def _send_packet(self):
-        self._send_one()
+        try:
+            self._sock.send(pkt)   # buffer protocol — no bytes() copy per packet
+        except ConnectionRefusedError:
+            pass   # connected UDP reports a closed port (no receiver yet) on a later send
+
+    def _send_loop(self, interval: float):
+        """Sender thread: fixed-rate deadline schedule, off the Qt event loop."""
+        raise_thread_priority()
+        # Windows waits round up to the 15.6 ms OS tick unless 1 ms is requested
+        if sys.platform == 'win32':
+            try:
+                ctypes.windll.winmm.timeBeginPeriod(1)
+            except Exception:
+                pass
+        try:
+            deadline = time.monotonic()
+            while True:
+                now = time.monotonic()
+                # Resync if a stall put us over a frame behind, rather than
+                # bursting out the missed packets back-to-back
+                if now - deadline > interval:
+                    deadline = now
+                deadline += interval
+                if self._send_stop.wait(max(0.0, deadline - now)):
+                    break
+                try:
+                    self._send_one()
+                except OSError:
+                    pass   # transient send failure — keep the stream going
+        finally:
+            if sys.platform == 'win32':
+                try:
+                    ctypes.windll.winmm.timeEndPeriod(1)
+                except Exception:
+                    pass
 
     def _start_sending(self):
         self._sending = True
         fps = self._spin_fps.value()
-        interval_ms = max(1, int(1000 / fps))
-        self._timer.start(interval_ms)
+        self._send_stop.clear()
+        self._send_thread = threading.Thread(
+            target=self._send_loop,
+            args=(1.0 / fps,),
+            daemon=True,
+            name='FreeDSendLoop',
+        )
+        self._send_thread.start()
         self._btn_start.setEnabled(False)
         self._btn_stop.setEnabled(True)
         self._btn_send_one.setEnabled(False)
@@ -537,14 +624,20 @@ class FreeDSimulator(QMainWindow):
 
     def _stop_sending(self):
         self._sending = False
-        self._timer.stop()
+        self._halt_sender()
         self._btn_start.setEnabled(True)
         self._btn_stop.setEnabled(False)
         self._btn_send_one.setEnabled(True)
         self._spin_fps.setEnabled(True)
 
+    def _halt_sender(self):
+        self._send_stop.set()
+        if self._send_thread is not None:
+            self._send_thread.join(timeout=1.0)
+            self._send_thread = None
+
     def closeEvent(self, event):
-        self._timer.stop()
+        self._halt_sender()
         self._sock.close()
         event.accept()
 
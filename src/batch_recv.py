@@ -0,0 +1,115 @@
+"""
+Batched UDP receive — wraps Linux recvmmsg(2) via ctypes.
+Available only on Linux with a libc that exports recvmmsg;
+FreeDReceiver falls back to one recvfrom() per packet when .available is False.
+"""
+import ctypes
+import ctypes.util
+import errno
+import select
+import socket
+import sys
+
+
+class _SockaddrIn(ctypes.Structure):
+    _fields_ = [
+        ('sin_family', ctypes.c_ushort),
+        ('sin_port',   ctypes.c_uint16),    # network byte order
+        ('sin_addr',   ctypes.c_uint8 * 4),
+        ('sin_zero',   ctypes.c_uint8 * 8),
+    ]
+
+
+class _Iovec(ctypes.Structure):
+    _fields_ = [
+        ('iov_base', ctypes.c_void_p),
+        ('iov_len',  ctypes.c_size_t),
+    ]
+
+
+class _Msghdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_name',       ctypes.c_void_p),
+        ('msg_namelen',    ctypes.c_uint32),
+        ('msg_iov',        ctypes.POINTER(_Iovec)),
+        ('msg_iovlen',     ctypes.c_size_t),
+        ('msg_control',    ctypes.c_void_p),
+        ('msg_controllen', ctypes.c_size_t),
+        ('msg_flags',      ctypes.c_int),
+    ]
+
+
+class _Mmsghdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_hdr', _Msghdr),
+        ('msg_len', ctypes.c_uint),
+    ]
+
+
+class BatchReceiver:
+    """
+    Drains up to batch_size queued datagrams from an AF_INET UDP socket with a
+    single recvmmsg() call.  All message headers, iovecs and receive buffers are
+    allocated once here and reused for every call.
+    .available = False on non-Linux platforms or if libc has no recvmmsg.
+    """
+
+    def __init__(self, sock: socket.socket, batch_size: int = 64, bufsize: int = 1024):
+        self.available  = False
+        self.init_error = ''   # populated with failure reason if init fails
+        self._sock      = sock
+        self._n         = max(1, int(batch_size))
+        self._bufsize   = bufsize
+        self._recvmmsg  = None
+        if not sys.platform.startswith('linux'):
+            self.init_error = 'recvmmsg is Linux-only'
+            return
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            fn = libc.recvmmsg
+            fn.restype  = ctypes.c_int
+            fn.argtypes = [ctypes.c_int, ctypes.POINTER(_Mmsghdr), ctypes.c_uint,
+                           ctypes.c_int, ctypes.c_void_p]
+        except (OSError, AttributeError) as e:
+            self.init_error = f'recvmmsg unavailable: {e}'
+            return
+        n = self._n
+        self._bufs  = ctypes.create_string_buffer(n * bufsize)
+        self._names = (_SockaddrIn * n)()
+        self._iovs  = (_Iovec * n)()
+        self._msgs  = (_Mmsghdr * n)()
+        base = ctypes.addressof(self._bufs)
+        for i in range(n):
+            self._iovs[i].iov_base = base + i * bufsize
+            self._iovs[i].iov_len  = bufsize
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_name    = ctypes.addressof(self._names[i])
+            hdr.msg_iov     = ctypes.pointer(self._iovs[i])
+            hdr.msg_iovlen  = 1
+        self._recvmmsg = fn
+        self.available = True
+
+    def recv(self, timeout: float = None) -> list:
+        """
+        Wait up to timeout seconds (None = forever) for the socket to become
+        readable, then return every queued datagram as a list of (bytes, (ip, port)).
+        Returns an empty list on timeout.
+        """
+        if not select.select([self._sock], [], [], timeout)[0]:
+            return []
+        msgs = self._msgs
+        for i in range(self._n):
+            msgs[i].msg_hdr.msg_namelen = ctypes.sizeof(_SockaddrIn)
+        count = self._recvmmsg(self._sock.fileno(), msgs, self._n, socket.MSG_DONTWAIT, None)
+        if count < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return []
+            raise OSError(err, errno.errorcode.get(err, 'recvmmsg failed'))
+        base = ctypes.addressof(self._bufs)
+        out = []
+        for i in range(count):
+            name = self._names[i]
+            addr = (socket.inet_ntoa(bytes(name.sin_addr)), socket.ntohs(name.sin_port))
+            out.append((ctypes.string_at(base + i * self._bufsize, msgs[i].msg_len), addr))
+        return out
@@ -2,13 +2,55 @@
 FreeD Protocol — parser, UDP receiver, GUI-aware receiver subclass.
 """
 
+import os
 import socket
 import sys
 import struct
+import threading
 import time
+from bisect import bisect_right
 from collections import deque
+from functools import lru_cache
 from datetime import datetime
 
+from src.batch_recv import BatchReceiver
+
+# Fixed 29-byte D1 layout, unpacked in a single call (the simulator packs with
+# it too).  struct has no 24-bit code, so each signed 24-bit field is read as a
+# signed high byte ('b') plus an unsigned low 16 bits ('H'); (hi << 16) | lo is
+# then already sign-extended.
+FREED_STRUCT = struct.Struct('>BB' + 'bH' * 8 + 'HB')
+
+
+@lru_cache(maxsize=4096)
+def _format_timecode(spare_value: int) -> str:
+    """HH:MM:SS:00 string for a bit-packed spare value (see FreeDParser.parse_timecode)."""
+    hours   = (spare_value >> 11) & 0x1F
+    minutes = (spare_value >>  5) & 0x3F
+    seconds = (spare_value &  0x1F) * 2
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}:00"
+
+
+def raise_thread_priority() -> None:
+    """Best-effort priority boost for the calling thread to cut scheduling jitter.
+
+    Windows: THREAD_PRIORITY_HIGHEST.  Linux: on a TID, setpriority() renices
+    just this thread to -10; going below 0 needs CAP_SYS_NICE or an RLIMIT_NICE
+    allowance, otherwise the thread keeps nice 0.  Failures are ignored.
+    """
+    if sys.platform == 'win32':
+        try:
+            import ctypes
+            ctypes.windll.kernel32.SetThreadPriority(
+                ctypes.windll.kernel32.GetCurrentThread(), 2)  # THREAD_PRIORITY_HIGHEST
+        except Exception:
+            pass
+    elif sys.platform.startswith('linux'):
+        try:
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), -10)
+        except (OSError, AttributeError):
+            pass
+
 
 class FreeDParser:
     """Parser for FreeD (D1) protocol data"""
@@ -43,34 +85,43 @@ class FreeDParser:
         Parse FreeD protocol packet
         Returns dict with camera tracking data or None if invalid
         """
+        # A memoryview into a reused receive buffer is copied once here so the
+        # result (raw_bytes, spare_bytes, extra_bytes) outlives the buffer
+        if not isinstance(data, bytes):
+            data = bytes(data)
+
         error_reason = None
         checksum_valid = True
         extra_bytes = None
 
+        size = len(data)
+
         # Check packet size - allow larger packets but warn
-        if len(data) < self.FREED_PACKET_SIZE:
-            error_reason = f"Packet too small: {len(data)} bytes (expected {self.FREED_PACKET_SIZE})"
+        if size < self.FREED_PACKET_SIZE:
+            error_reason = f"Packet too small: {size} bytes (expected {self.FREED_PACKET_SIZE})"
             if self.debug:
                 print(f"  ERROR: {error_reason}")
             return None
-        elif len(data) > self.FREED_PACKET_SIZE:
+        elif size > self.FREED_PACKET_SIZE:
             # Packet is larger than expected - capture extra bytes for analysis
             extra_bytes = data[self.FREED_PACKET_SIZE:]
             if self.debug:
-                print(f"  WARNING: Packet larger than expected: {len(data)} bytes (expected {self.FREED_PACKET_SIZE})")
+                print(f"  WARNING: Packet larger than expected: {size} bytes (expected {self.FREED_PACKET_SIZE})")
                 print(f"  Extra {len(extra_bytes)} bytes detected: {extra_bytes.hex(' ').upper()}")
 
         # Verify message type
-        if data[0] != self.FREED_MESSAGE_TYPE:
-            error_reason = f"Invalid message type: 0x{data[0]:02X} (expected 0x{self.FREED_MESSAGE_TYPE:02X})"
+        msg_type = data[0]
+        if msg_type != self.FREED_MESSAGE_TYPE:
+            error_reason = f"Invalid message type: 0x{msg_type:02X} (expected 0x{self.FREED_MESSAGE_TYPE:02X})"
             if self.debug:
                 print(f"  ERROR: {error_reason}")
             return None
 
-        # Verify checksum: device uses (byte26 + byte27 + byte28) & 0xFF == 0xF6
+        # Verify checksum: device uses (byte26 + byte27 + byte28) & 0xFF == 0xF6,
+        # which is equivalent to byte28 == expected — compute it once and compare
         calculated_checksum = self.calculate_checksum(data)
         packet_checksum = data[28]
-        checksum_valid = self.verify_checksum(data)
+        checksum_valid = packet_checksum == calculated_checksum
 
         if not checksum_valid:
             if not self.ignore_checksum:
@@ -79,22 +130,25 @@ class FreeDParser:
                     print(f"  WARNING: Checksum mismatch: 0x{packet_checksum:02X} (expected 0x{calculated_checksum:02X}) - Parsing anyway")
             # Continue parsing despite checksum error (silently if ignore_checksum is True)
 
-        # Parse data
-        camera_id = data[1]
-        pan = self.parse_24bit_int(data[2:5])
-        tilt = self.parse_24bit_int(data[5:8])
-        roll = self.parse_24bit_int(data[8:11])
-        x = self.parse_24bit_int(data[11:14])
-        y = self.parse_24bit_int(data[14:17])
-        z = self.parse_24bit_int(data[17:20])
-        zoom = self.parse_24bit_int(data[20:23])
-        focus = self.parse_24bit_int(data[23:26])
-        spare = struct.unpack('>H', data[26:28])[0]
+        # Parse data — one unpack_from for all fields, no per-field slices
+        (_, camera_id,
+         pan_hi, pan_lo, tilt_hi, tilt_lo, roll_hi, roll_lo,
+         x_hi, x_lo, y_hi, y_lo, z_hi, z_lo,
+         zoom_hi, zoom_lo, focus_hi, focus_lo,
+         spare, _) = FREED_STRUCT.unpack_from(data, 0)
+        pan = (pan_hi << 16) | pan_lo
+        tilt = (tilt_hi << 16) | tilt_lo
+        roll = (roll_hi << 16) | roll_lo
+        x = (x_hi << 16) | x_lo
+        y = (y_hi << 16) | y_lo
+        z = (z_hi << 16) | z_lo
+        zoom = (zoom_hi << 16) | zoom_lo
+        focus = (focus_hi << 16) | focus_lo
         spare_bytes = data[26:28]
 
         # Extended TC block: bytes 29–32 (H, M, S, F — one byte each)
         ext_tc = None
-        if len(data) >= 33:
+        if size >= 33:
             ext_tc = (data[29], data[30], data[31], data[32])
 
         self.packet_count += 1
@@ -113,17 +167,29 @@ class FreeDParser:
             'checksum_valid': checksum_valid,
             'checksum_expected': calculated_checksum,
             'checksum_actual': packet_checksum,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': time.time(),   # epoch seconds; formatted only when displayed
             'extra_bytes': extra_bytes,
-            'packet_size': len(data),
-            'message_type': data[0],
-            'raw_bytes': bytes(data)
+            'packet_size': size,
+            'message_type': msg_type,
+            # recvfrom() already hands us immutable bytes — only copy mutable buffers
+            'raw_bytes': data
         }
 
 
 class FreeDReceiver:
     """UDP receiver for FreeD protocol data"""
 
+    # SO_RCVBUF request — room for seconds of multi-camera traffic while the
+    # consumer stalls.  Linux caps it at net.core.rmem_max (raise with sysctl).
+    RECV_BUFFER_SIZE = 4 * 1024 * 1024
+
+    # Separator lines for the console display
+    _RULE      = '=' * 80
+    _THIN_RULE = '-' * 80
+
+    # Printable ASCII maps to itself, everything else to '.' (for bytes.translate)
+    _ASCII_TABLE = bytes(b if 32 <= b < 127 else 0x2E for b in range(256))
+
     # Lens calibration tables for piecewise-linear interpolation
     # Fujinon Premista 28-100mm (raw = value × 1000)
     zoom_calibration = [
@@ -141,7 +207,7 @@ class FreeDReceiver:
         (629000, 629.0),
     ]
 
-    def __init__(self, host: str = '0.0.0.0', port: int = 45000, debug: bool = False, step_by_step: bool = False, delay: float = 0.0, ignore_checksum: bool = False, timecode_fps: float = None, convert_units: bool = False, clear_screen: bool = False):
+    def __init__(self, host: str = '0.0.0.0', port: int = 45000, debug: bool = False, step_by_step: bool = False, delay: float = 0.0, ignore_checksum: bool = False, timecode_fps: float = None, convert_units: bool = False, clear_screen: bool = False, batch_size: int = 64):
         self.host = host
         self.port = port
         self.socket = None
@@ -151,10 +217,12 @@ class FreeDReceiver:
         self._last_error = None   # set if receive_loop exits due to an exception
         self.step_by_step = step_by_step
         self.delay = delay
+        self._next_deadline = None   # monotonic time the next --delay slot ends
         self.ignore_checksum = ignore_checksum
         self.timecode_fps = timecode_fps
         self.convert_units = convert_units
         self.clear_screen = clear_screen
+        self.batch_size = batch_size   # datagrams per recvmmsg() call; <= 1 disables batching
 
         # Timecode tracking for analysis
         self.last_spare_value = None
@@ -167,25 +235,34 @@ class FreeDReceiver:
         self.rotation_scale = 1.0 / 32768.0  # raw / 32768 = degrees
         self.position_scale = 1.0 / 64.0     # raw / 64.0 = millimeters
 
+        # Lens lookup tables: breakpoints + precomputed slopes, searched with bisect
+        self._zoom_lut  = self._build_lut(self.zoom_calibration)
+        self._focus_lut = self._build_lut(self.focus_calibration)
+
     @staticmethod
-    def _interpolate(calibration, raw_value: float) -> float:
-        if raw_value <= calibration[0][0]:
-            return calibration[0][1]
-        if raw_value >= calibration[-1][0]:
-            return calibration[-1][1]
-        for i in range(len(calibration) - 1):
-            raw_lo, val_lo = calibration[i]
-            raw_hi, val_hi = calibration[i + 1]
-            if raw_lo <= raw_value <= raw_hi:
-                t = (raw_value - raw_lo) / (raw_hi - raw_lo)
-                return val_lo + t * (val_hi - val_lo)
-        return calibration[0][1]
+    def _build_lut(calibration) -> tuple:
+        """Split a calibration table into (raws, values, segment slopes) for _interpolate."""
+        raws   = tuple(p[0] for p in calibration)
+        vals   = tuple(p[1] for p in calibration)
+        slopes = tuple((v_hi - v_lo) / (r_hi - r_lo)
+                       for (r_lo, v_lo), (r_hi, v_hi) in zip(calibration, calibration[1:]))
+        return raws, vals, slopes
+
+    @staticmethod
+    def _interpolate(lut: tuple, raw_value: float) -> float:
+        raws, vals, slopes = lut
+        if raw_value <= raws[0]:
+            return vals[0]
+        if raw_value >= raws[-1]:
+            return vals[-1]
+        i = bisect_right(raws, raw_value) - 1
+        return vals[i] + (raw_value - raws[i]) * slopes[i]
 
     def interpolate_zoom(self, raw_value: float) -> float:
-        return self._interpolate(self.zoom_calibration, raw_value)
+        return self._interpolate(self._zoom_lut, raw_value)
 
     def interpolate_focus(self, raw_value: float) -> float:
-        return self._interpolate(self.focus_calibration, raw_value)
+        return self._interpolate(self._focus_lut, raw_value)
 
     def parse_timecode(self, spare_value: int, fps: float) -> str:
         """
@@ -197,10 +274,7 @@ class FreeDReceiver:
         """
         if fps is None or fps <= 0:
             return None
-        hours   = (spare_value >> 11) & 0x1F
-        minutes = (spare_value >>  5) & 0x3F
-        seconds = (spare_value &  0x1F) * 2
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}:00"
+        return _format_timecode(spare_value)
 
     def start(self):
         """Start listening for FreeD data"""
@@ -224,6 +298,16 @@ class FreeDReceiver:
             except OSError:
                 pass
 
+            # Deep kernel queue so bursts survive a slow console without drops
+            try:
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.RECV_BUFFER_SIZE)
+            except OSError:
+                pass
+
+            # Wake periodically so receive_loop sees running=False / Ctrl+C
+            # promptly (a blocking recv is not interruptible on Windows)
+            self.socket.settimeout(0.5)
+
             self.socket.bind((self.host, self.port))
 
             print(f"FreeD Receiver started")
@@ -240,50 +324,32 @@ class FreeDReceiver:
 
     def receive_loop(self):
         """Main receive loop"""
-        # Raise thread priority on Windows to reduce OS scheduling jitter
-        if sys.platform == 'win32':
-            try:
-                import ctypes
-                ctypes.windll.kernel32.SetThreadPriority(
-                    ctypes.windll.kernel32.GetCurrentThread(), 2)  # THREAD_PRIORITY_HIGHEST
-            except Exception:
-                pass
+        raise_thread_priority()
+
+        # On Linux drain queued datagrams with one recvmmsg() per wake-up;
+        # elsewhere (or if libc lacks it) fall back to one recvfrom() per packet
+        batch = BatchReceiver(self.socket, self.batch_size) if self.batch_size > 1 else None
+        if batch is not None and not batch.available:
+            batch = None
+        buf  = bytearray(1024)   # reused by recvfrom_into() on the fallback path
+        view = memoryview(buf)
 
         try:
             while self.running:
+                if batch is not None:
+                    packets = batch.recv(self.socket.gettimeout())
+                    recv_time = time.monotonic()  # timestamp immediately at receive
+                    if not packets:
+                        continue  # no data yet — keep waiting, don't kill the thread
+                    for data, addr in packets:
+                        self._handle_packet(data, addr, recv_time)
+                    continue
                 try:
-                    data, addr = self.socket.recvfrom(1024)
+                    n, addr = self.socket.recvfrom_into(buf)
                     recv_time = time.monotonic()  # timestamp immediately at receive
                 except socket.timeout:
                     continue  # no data yet — keep waiting, don't kill the thread
-
-                # Show raw packet in debug mode
-                if self.debug:
-                    print(f"\n{'='*80}")
-                    print(f"Packet #{self.parser.packet_count + self.parser.error_count + 1} from {addr[0]}:{addr[1]}")
-                    print(f"Size: {len(data)} bytes")
-                    print(f"Raw hex: {data.hex(' ')}")
-                    print(f"Raw bytes: {' '.join(f'{b:02X}' for b in data)}")
-
-                # Parse FreeD data
-                parsed_data = self.parser.parse(data)
-
-                if parsed_data:
-                    self.display_data(parsed_data, addr, recv_time=recv_time)
-                else:
-                    if not self.debug:
-                        print(f"\nInvalid packet from {addr[0]}:{addr[1]} - Size: {len(data)} bytes - Hex: {data[:10].hex(' ')}...")
-
-                # Add delay if specified
-                if self.delay > 0:
-                    time.sleep(self.delay)
-
-                # Wait for user input in step-by-step mode
-                if self.step_by_step:
-                    try:
-                        input("\nPress Enter for next packet (or Ctrl+C to quit)...")
-                    except KeyboardInterrupt:
-                        raise
+                self._handle_packet(view[:n], addr, recv_time)
 
         except KeyboardInterrupt:
             print("\n\nShutting down...")
@@ -293,22 +359,57 @@ class FreeDReceiver:
             print(f"Error in receive loop: {e}")
             self.stop()
 
+    def _handle_packet(self, data: bytes, addr: tuple, recv_time: float):
+        """Parse and display one received datagram"""
+        # Show raw packet in debug mode.  All formatting stays behind this one
+        # check, and the header goes out in a single write.
+        if self.debug:
+            print(f"\n{self._RULE}\n"
+                  f"Packet #{self.parser.packet_count + self.parser.error_count + 1} from {addr[0]}:{addr[1]}\n"
+                  f"Size: {len(data)} bytes\n"
+                  f"Raw hex: {data.hex(' ').upper()}")
+
+        # Parse FreeD data
+        parsed_data = self.parser.parse(data)
+
+        if parsed_data:
+            self.display_data(parsed_data, addr, recv_time=recv_time)
+        else:
+            if not self.debug:
+                print(f"\nInvalid packet from {addr[0]}:{addr[1]} - Size: {len(data)} bytes - Hex: {data[:10].hex(' ')}...")
+
+        # Pace to one packet per delay period: sleep only for what is left of
+        # the slot after parse/display, and resync if we fell a slot behind
+        if self.delay > 0:
+            now = time.monotonic()
+            if self._next_deadline is None or now - self._next_deadline > self.delay:
+                self._next_deadline = now
+            self._next_deadline += self.delay
+            remaining = self._next_deadline - now
+            if remaining > 0:
+                time.sleep(remaining)
+
+        # Wait for user input in step-by-step mode
+        if self.step_by_step:
+            try:
+                input("\nPress Enter for next packet (or Ctrl+C to quit)...")
+            except KeyboardInterrupt:
+                raise
+
     def display_data(self, data: dict, addr: tuple, recv_time: float = None):
         """Display parsed FreeD data"""
-        # Build output buffer to reduce flicker
-        if self.clear_screen:
-            output = []
-        else:
-            output = None
+        # Collect every line and write the block in one call at the end
+        output = []
+        add_line = output.append
 
-        def add_line(text):
-            if output is not None:
-                output.append(text)
-            else:
-                print(text)
+        # Field values are read out of the result dict once, not per line
+        pan, tilt, roll = data['pan'], data['tilt'], data['roll']
+        pos = data['position']
+        x, y, z = pos['x'], pos['y'], pos['z']
+        zoom, focus = data['zoom'], data['focus']
 
         if not self.debug:
-            add_line(f"\n{'='*80}")
+            add_line('\n' + self._RULE)
 
         # Header with checksum warning if needed (hide if ignoring checksums)
         if self.ignore_checksum:
@@ -317,58 +418,58 @@ class FreeDReceiver:
         else:
             checksum_status = "✓" if data['checksum_valid'] else "✗ CHECKSUM WARNING"
             add_line(f"Camera ID: {data['camera_id']} | From: {addr[0]}:{addr[1]} | {checksum_status}")
-        add_line(f"{'-'*80}")
+        add_line(self._THIN_RULE)
 
         # Rotation
         add_line(f"Rotation:")
         if self.convert_units:
-            pan_deg = data['pan'] * self.rotation_scale
-            tilt_deg = data['tilt'] * self.rotation_scale
-            roll_deg = data['roll'] * self.rotation_scale
-            add_line(f"  Pan:   {pan_deg:10.2f}°  (raw: {data['pan']:10d})")
-            add_line(f"  Tilt:  {tilt_deg:10.2f}°  (raw: {data['tilt']:10d})")
-            add_line(f"  Roll:  {roll_deg:10.2f}°  (raw: {data['roll']:10d})")
+            pan_deg = pan * self.rotation_scale
+            tilt_deg = tilt * self.rotation_scale
+            roll_deg = roll * self.rotation_scale
+            add_line(f"  Pan:   {pan_deg:10.2f}°  (raw: {pan:10d})")
+            add_line(f"  Tilt:  {tilt_deg:10.2f}°  (raw: {tilt:10d})")
+            add_line(f"  Roll:  {roll_deg:10.2f}°  (raw: {roll:10d})")
         else:
-            add_line(f"  Pan:   {data['pan']:10d}  (0x{data['pan'] & 0xFFFFFF:06X})")
-            add_line(f"  Tilt:  {data['tilt']:10d}  (0x{data['tilt'] & 0xFFFFFF:06X})")
-            add_line(f"  Roll:  {data['roll']:10d}  (0x{data['roll'] & 0xFFFFFF:06X})")
+            add_line(f"  Pan:   {pan:10d}  (0x{pan & 0xFFFFFF:06X})")
+            add_line(f"  Tilt:  {tilt:10d}  (0x{tilt & 0xFFFFFF:06X})")
+            add_line(f"  Roll:  {roll:10d}  (0x{roll & 0xFFFFFF:06X})")
 
         # Position
         add_line(f"\nPosition:")
         if self.convert_units:
-            x_mm = data['position']['x'] * self.position_scale
-            y_mm = data['position']['y'] * self.position_scale
-            z_mm = data['position']['z'] * self.position_scale
+            x_mm = x * self.position_scale
+            y_mm = y * self.position_scale
+            z_mm = z * self.position_scale
             x_m = x_mm / 1000.0
             y_m = y_mm / 1000.0
             z_m = z_mm / 1000.0
-            add_line(f"  X:     {x_m:10.3f}m  ({x_mm:10.1f}mm, raw: {data['position']['x']:10d})")
-            add_line(f"  Y:     {y_m:10.3f}m  ({y_mm:10.1f}mm, raw: {data['position']['y']:10d})")
-            add_line(f"  Z:     {z_m:10.3f}m  ({z_mm:10.1f}mm, raw: {data['position']['z']:10d})")
+            add_line(f"  X:     {x_m:10.3f}m  ({x_mm:10.1f}mm, raw: {x:10d})")
+            add_line(f"  Y:     {y_m:10.3f}m  ({y_mm:10.1f}mm, raw: {y:10d})")
+            add_line(f"  Z:     {z_m:10.3f}m  ({z_mm:10.1f}mm, raw: {z:10d})")
         else:
-            add_line(f"  X:     {data['position']['x']:10d}  (0x{data['position']['x'] & 0xFFFFFF:06X})")
-            add_line(f"  Y:     {data['position']['y']:10d}  (0x{data['position']['y'] & 0xFFFFFF:06X})")
-            add_line(f"  Z:     {data['position']['z']:10d}  (0x{data['position']['z'] & 0xFFFFFF:06X})")
+            add_line(f"  X:     {x:10d}  (0x{x & 0xFFFFFF:06X})")
+            add_line(f"  Y:     {y:10d}  (0x{y & 0xFFFFFF:06X})")
+            add_line(f"  Z:     {z:10d}  (0x{z & 0xFFFFFF:06X})")
 
         # Lens
         add_line(f"\nLens Data:")
         if self.convert_units:
             # Zoom: Piecewise linear interpolation using calibration points
-            focal_length = self.interpolate_zoom(data['zoom'])
+            focal_length = self.interpolate_zoom(zoom)
 
             # Focus: Piecewise linear interpolation using calibration points
-            focus_distance = self.interpolate_focus(data['focus'])
+            focus_distance = self.interpolate_focus(focus)
 
             # Convert meters to feet and inches
             total_inches = focus_distance * 39.3701
             feet = int(total_inches // 12)
             inches = total_inches % 12
 
-            add_line(f"  Zoom:  {focal_length:10.1f}mm focal length  (raw: {data['zoom']:10d})")
-            add_line(f"  Focus: {focus_distance:10.2f}m ({feet}ft {inches:.1f}in) (raw: {data['focus']:10d})")
+            add_line(f"  Zoom:  {focal_length:10.1f}mm focal length  (raw: {zoom:10d})")
+            add_line(f"  Focus: {focus_distance:10.2f}m ({feet}ft {inches:.1f}in) (raw: {focus:10d})")
         else:
-            add_line(f"  Zoom:  {data['zoom']:10d}  (0x{data['zoom'] & 0xFFFFFF:06X})")
-            add_line(f"  Focus: {data['focus']:10d}  (0x{data['focus'] & 0xFFFFFF:06X})")
+            add_line(f"  Zoom:  {zoom:10d}  (0x{zoom & 0xFFFFFF:06X})")
+            add_line(f"  Focus: {focus:10d}  (0x{focus & 0xFFFFFF:06X})")
 
         # Spare bytes / Timecode
         add_line(f"\nSpare/Timecode:")
@@ -413,7 +514,7 @@ class FreeDReceiver:
             add_line(f"\n⚠️  EXTRA DATA DETECTED:")
             add_line(f"  Extra bytes: {len(data['extra_bytes'])} bytes")
             add_line(f"  Hex: {data['extra_bytes'].hex(' ').upper()}")
-            add_line(f"  ASCII: {' '.join(chr(b) if 32 <= b < 127 else '.' for b in data['extra_bytes'])}")
+            add_line(f"  ASCII: {' '.join(data['extra_bytes'].translate(self._ASCII_TABLE).decode('ascii'))}")
             add_line(f"  Decimal: {' '.join(str(b) for b in data['extra_bytes'])}")
 
         # Checksum info (only show if not ignoring checksums)
@@ -425,13 +526,14 @@ class FreeDReceiver:
             add_line(f"\nPackets: {self.parser.packet_count}")
         else:
             add_line(f"\nPackets: {self.parser.packet_count} valid | {self.parser.error_count} checksum errors")
-        add_line(f"Time: {data['timestamp']}")
-        add_line(f"{'='*80}")
+        add_line(f"Time: {datetime.fromtimestamp(data['timestamp']).isoformat()}")
+        add_line(self._RULE)
 
-        # If using clear screen mode, print entire buffer at once to reduce flicker
-        if output is not None:
-            # Move cursor to home and print everything at once
+        if self.clear_screen:
+            # Move cursor to home and redraw in place to reduce flicker
             print('\033[H' + '\n'.join(output), end='', flush=True)
+        else:
+            print('\n'.join(output))
 
     def stop(self):
         """Stop the receiver"""
@@ -453,6 +555,7 @@ class FreeDReceiverGUI(FreeDReceiver):
         self.packet_interval_ms = None   # smoothed ms between packets
         self.packet_fps = None           # smoothed fps
         self._interval_history = deque(maxlen=30)   # rolling window (avg/fps)
+        self._interval_sum     = 0.0                # running sum of _interval_history
         self._gl_phase_history = deque(maxlen=8)    # phase counter cycling → locked
         self._jitter_history   = deque(maxlen=500)  # long history for jitter tab
         self._rfc_jitter       = 0.0                # RFC 3550-style jitter accumulator
@@ -475,6 +578,7 @@ class FreeDReceiverGUI(FreeDReceiver):
             # Gap >2s means we just reconnected — reset history so fps is clean
             if interval > 2000.0:
                 self._interval_history.clear()
+                self._interval_sum = 0.0
                 self._gl_phase_history.clear()
                 self._jitter_history.clear()
                 self._x_history.clear(); self._y_history.clear(); self._z_history.clear()
@@ -482,8 +586,12 @@ class FreeDReceiverGUI(FreeDReceiver):
                 self._rfc_jitter    = 0.0
                 self._prev_interval = None
             else:
-                self._interval_history.append(interval)
-                avg = sum(self._interval_history) / len(self._interval_history)
+                hist = self._interval_history
+                if len(hist) == hist.maxlen:
+                    self._interval_sum -= hist[0]   # value about to fall out of the window
+                hist.append(interval)
+                self._interval_sum += interval
+                avg = self._interval_sum / len(hist)
                 self.packet_interval_ms = avg
                 self.packet_fps = 1000.0 / avg if avg > 0 else None
                 self._jitter_history.append(interval)
@@ -504,6 +612,9 @@ class FreeDReceiverGUI(FreeDReceiver):
         rb = data.get('raw_bytes')
         if rb and len(rb) > 26:
             self._gl_phase_history.append((rb[26] >> 4) & 0xF)
+        # Single-slot hand-off: each packet overwrites the last (atomic rebind).
+        # Nothing queues, so a slow GUI tick renders only the newest packet —
+        # skipped ones are still counted, forwarded and fed to the histories.
         self.latest_data = data
         self.latest_addr = addr
         if self.on_packet is not None:
@@ -2,8 +2,13 @@
 """Comprehensive unit tests for FreeD protocol components."""
 import sys
 import os
+import importlib.util
 import json
+import socket
+import subprocess
 import tempfile
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -11,6 +16,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.protocol import FreeDParser, FreeDReceiver, FreeDReceiverGUI
 from src.opentrackio import OpenTrackIOSender
+from src.batch_recv import BatchReceiver
 
 
 # ---------------------------------------------------------------------------
@@ -67,6 +73,20 @@ def build_freed_packet(
     return bytes(pkt)
 
 
+def _make_packet(**overrides) -> bytes:
+    """Build a valid packet for camera 1 at rest; keywords override fields."""
+    fields = dict(
+        camera_id=1,
+        pan_deg=0.0, tilt_deg=0.0, roll_deg=0.0,
+        x_m=0.0, y_m=0.0, z_m=0.0,
+        zoom_mm=50.0, zoom_no_data=False,
+        focus_m=1.0, focus_no_data=False,
+        genlock_on=False, phase_counter=0,
+    )
+    fields.update(overrides)
+    return build_freed_packet(**fields)
+
+
 # ---------------------------------------------------------------------------
 # 1. FreeDParser
 # ---------------------------------------------------------------------------
@@ -124,16 +144,33 @@ class TestFreeDParser(unittest.TestCase):
         pkt[26] = 0x31; pkt[27] = 0x20; pkt[28] = 0x00  # wrong
         self.assertFalse(self.parser.verify_checksum(bytes(pkt)))
 
+    def test_parse_checksum_valid_matches_verify_checksum(self):
+        pkt = bytearray(29)
+        pkt[0] = 0xD1
+        for b26, b27, b28 in [(0x00, 0x00, 0xF6), (0xF0, 0x20, 0xE6),
+                              (0xFF, 0xFF, 0xF8), (0x31, 0x20, 0x00)]:
+            pkt[26], pkt[27], pkt[28] = b26, b27, b28
+            result = self.parser.parse(bytes(pkt))
+            self.assertEqual(result['checksum_valid'], self.parser.verify_checksum(bytes(pkt)))
+            self.assertEqual(result['checksum_expected'], self.parser.calculate_checksum(bytes(pkt)))
+
+    def test_parse_24bit_fields_sign_extended(self):
+        pkt = bytearray(29)
+        pkt[0] = 0xD1
+        pkt[2:26] = bytes([0x80, 0x00, 0x00,  0x7F, 0xFF, 0xFF,  0xFF, 0xFF, 0xFF,
+                           0x00, 0x00, 0x01,  0xFF, 0x00, 0x00,  0x01, 0x77, 0x00,
+                           0x00, 0xC3, 0x50,  0xFE, 0xDC, 0xBA])
+        result = self.parser.parse(bytes(pkt))
+        fields = [result['pan'], result['tilt'], result['roll'],
+                  result['position']['x'], result['position']['y'], result['position']['z'],
+                  result['zoom'], result['focus']]
+        expected = [int.from_bytes(pkt[o:o + 3], 'big', signed=True) for o in range(2, 26, 3)]
+        self.assertEqual(fields, expected)
+        self.assertEqual(fields[:3], [-8388608, 8388607, -1])
+
     def _make_valid_packet(self, camera_id=1):
         """Build a minimal valid 29-byte FreeD D1 packet."""
-        return build_freed_packet(
-            camera_id=camera_id,
-            pan_deg=0.0, tilt_deg=0.0, roll_deg=0.0,
-            x_m=0.0, y_m=0.0, z_m=0.0,
-            zoom_mm=50.0, zoom_no_data=False,
-            focus_m=1.0, focus_no_data=False,
-            genlock_on=False, phase_counter=0,
-        )
+        return _make_packet(camera_id=camera_id)
 
     def test_parse_valid_packet(self):
         pkt = self._make_valid_packet(camera_id=3)
@@ -142,6 +179,18 @@ class TestFreeDParser(unittest.TestCase):
         self.assertEqual(result['camera_id'], 3)
         self.assertTrue(result['checksum_valid'])
 
+    def test_parse_raw_bytes_not_copied(self):
+        pkt = self._make_valid_packet()
+        result = self.parser.parse(pkt)
+        self.assertIs(result['raw_bytes'], pkt)
+        result = self.parser.parse(bytearray(pkt))
+        self.assertIsInstance(result['raw_bytes'], bytes)
+        self.assertEqual(result['raw_bytes'], pkt)
+
+    def test_parse_timestamp_is_epoch_float(self):
+        result = self.parser.parse(self._make_valid_packet())
+        self.assertIsInstance(result['timestamp'], float)
+
     def test_parse_too_small(self):
         result = self.parser.parse(bytes(10))
         self.assertIsNone(result)
@@ -216,6 +265,13 @@ class TestFreeDReceiverInterpolation(unittest.TestCase):
         mid_val = (val0 + val1) / 2.0
         self.assertAlmostEqual(self.recv.interpolate_zoom(mid_raw), mid_val, places=6)
 
+    def test_interpolate_zoom_every_segment(self):
+        cal = self.recv.zoom_calibration
+        for (raw_lo, val_lo), (raw_hi, val_hi) in zip(cal, cal[1:]):
+            raw = raw_lo + 0.25 * (raw_hi - raw_lo)
+            expected = val_lo + 0.25 * (val_hi - val_lo)
+            self.assertAlmostEqual(self.recv.interpolate_zoom(raw), expected, places=6)
+
     # Focus
     def test_interpolate_focus_exact_points(self):
         for raw, expected in self.recv.focus_calibration:
@@ -252,6 +308,21 @@ class TestFreeDReceiverInterpolation(unittest.TestCase):
         tc = self.recv.parse_timecode(0, 0)
         self.assertIsNone(tc)
 
+    # --delay pacing
+    def test_delay_sleeps_only_remaining_slot(self):
+        recv = FreeDReceiver(port=59999, delay=0.1)
+        with patch('src.protocol.time') as fake_time, \
+                patch('builtins.print'):
+            # 2nd packet handled 30 ms after the 1st slot ended; 3rd far behind
+            fake_time.monotonic.side_effect = [0.0, 0.13, 5.0]
+            for _ in range(3):
+                recv._handle_packet(b'\xD1', ('127.0.0.1', 1), 0.0)
+        sleeps = [c.args[0] for c in fake_time.sleep.call_args_list]
+        self.assertEqual(len(sleeps), 3)
+        self.assertAlmostEqual(sleeps[0], 0.1)
+        self.assertAlmostEqual(sleeps[1], 0.07)
+        self.assertAlmostEqual(sleeps[2], 0.1)   # resynced, no catch-up burst
+
 
 # ---------------------------------------------------------------------------
 # 3. Build FreeD packet helpers
@@ -260,16 +331,7 @@ class TestFreeDReceiverInterpolation(unittest.TestCase):
 class TestBuildFreeDPacket(unittest.TestCase):
 
     def _pkt(self, **kwargs):
-        defaults = dict(
-            camera_id=1,
-            pan_deg=0.0, tilt_deg=0.0, roll_deg=0.0,
-            x_m=0.0, y_m=0.0, z_m=0.0,
-            zoom_mm=50.0, zoom_no_data=False,
-            focus_m=1.0, focus_no_data=False,
-            genlock_on=False, phase_counter=0,
-        )
-        defaults.update(kwargs)
-        return build_freed_packet(**defaults)
+        return _make_packet(**kwargs)
 
     def test_packet_is_29_bytes(self):
         self.assertEqual(len(self._pkt()), 29)
@@ -510,5 +572,192 @@ class TestInjectTCChecksum(unittest.TestCase):
             import shutil; shutil.rmtree(tmpdir, ignore_errors=True)
 
 
+# ---------------------------------------------------------------------------
+# 8. Batched UDP receive
+# ---------------------------------------------------------------------------
+
+class TestBatchReceive(unittest.TestCase):
+
+    def setUp(self):
+        self.rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.rx.bind(('127.0.0.1', 0))
+        self.rx.settimeout(0.5)
+        self.tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.tx.bind(('127.0.0.1', 0))
+        self.dest = self.rx.getsockname()
+
+    def tearDown(self):
+        self.rx.close()
+        self.tx.close()
+
+    def _packets(self, n):
+        return [_make_packet(camera_id=i + 1, pan_deg=float(i)) for i in range(n)]
+
+    @unittest.skipUnless(sys.platform.startswith('linux'), 'recvmmsg is Linux-only')
+    def test_batch_receiver_drains_queue_in_one_call(self):
+        batch = BatchReceiver(self.rx, batch_size=8)
+        self.assertTrue(batch.available, batch.init_error)
+        pkts = self._packets(3)
+        for pkt in pkts:
+            self.tx.sendto(pkt, self.dest)
+        time.sleep(0.05)
+        got = batch.recv(0.5)
+        self.assertEqual([d for d, _ in got], pkts)
+        self.assertEqual(got[0][1], self.tx.getsockname())
+
+    @unittest.skipUnless(sys.platform.startswith('linux'), 'recvmmsg is Linux-only')
+    def test_batch_receiver_timeout_returns_empty(self):
+        batch = BatchReceiver(self.rx)
+        self.assertEqual(batch.recv(0.01), [])
+
+    def test_receive_loop_parses_every_packet(self):
+        recv = FreeDReceiverGUI(port=0, ignore_checksum=True)
+        recv.socket = self.rx
+        recv.running = True
+        seen = []
+        recv.on_packet_parsed = lambda d: seen.append(d['camera_id'])
+        thread = threading.Thread(target=recv.receive_loop, daemon=True)
+        thread.start()
+        for pkt in self._packets(5):
+            self.tx.sendto(pkt, self.dest)
+        deadline = time.monotonic() + 2.0
+        while len(seen) < 5 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        recv.running = False
+        thread.join(timeout=2.0)
+        self.assertEqual(seen, [1, 2, 3, 4, 5])
+        self.assertEqual(recv.parser.packet_count, 5)
+
+    def test_recvfrom_into_fallback_detaches_packets(self):
+        recv = FreeDReceiverGUI(port=0, ignore_checksum=True, batch_size=1)
+        recv.socket = self.rx
+        recv.running = True
+        seen = []
+        recv.on_packet_parsed = seen.append
+        pkts = self._packets(3)
+        pkts[1] += b'\xAA\xBB'   # longer datagram between two 29-byte ones
+        thread = threading.Thread(target=recv.receive_loop, daemon=True)
+        thread.start()
+        for pkt in pkts:
+            self.tx.sendto(pkt, self.dest)
+        deadline = time.monotonic() + 2.0
+        while len(seen) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        recv.running = False
+        thread.join(timeout=2.0)
+        self.assertEqual([d['raw_bytes'] for d in seen], pkts)
+        self.assertEqual(seen[1]['extra_bytes'], b'\xAA\xBB')
+        self.assertIsInstance(seen[1]['extra_bytes'], bytes)
+
+
+# ---------------------------------------------------------------------------
+# 9. FreeDReceiverGUI packet statistics
+# ---------------------------------------------------------------------------
+
+class TestReceiverGUIStats(unittest.TestCase):
+
+    def setUp(self):
+        self.recv = FreeDReceiverGUI(port=59999)
+        self.data = FreeDParser().parse(_make_packet())
+
+    def _feed(self, times):
+        for t in times:
+            self.recv.display_data(self.data, ('127.0.0.1', 1), recv_time=t)
+
+    def test_interval_average_over_rolling_window(self):
+        # 100 packets with intervals cycling 10/20/30 ms; window keeps last 30
+        times, t = [], 0.0
+        for i in range(100):
+            times.append(t)
+            t += (10, 20, 30)[i % 3] / 1000.0
+        self._feed(times)
+        window = list(self.recv._interval_history)
+        self.assertEqual(len(window), 30)
+        self.assertAlmostEqual(self.recv.packet_interval_ms, sum(window) / 30, places=9)
+        self.assertAlmostEqual(self.recv.packet_fps, 1000.0 / (sum(window) / 30), places=6)
+
+    def test_interval_average_resets_after_gap(self):
+        self._feed([0.0, 0.010, 0.020, 5.0, 5.040, 5.080])
+        self.assertEqual(len(self.recv._interval_history), 2)
+        self.assertAlmostEqual(self.recv.packet_interval_ms, 40.0, places=9)
+
+
+
+# ---------------------------------------------------------------------------
+# 10. FreeDDashboard packet-driven redraw
+# ---------------------------------------------------------------------------
+
+# Runs in a child process: the dashboard needs the real PyQt6, while the
+# tests above import freed_reader against stubs
+_DASHBOARD_STREAM_SCRIPT = r"""
+import json, os, socket, sys, threading, time
+sys.path.insert(0, sys.argv[1])
+probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+probe.bind(('127.0.0.1', 0))
+port = probe.getsockname()[1]
+probe.close()
+app_dir = os.path.join(os.environ['APPDATA'], 'FreeDReader')
+os.makedirs(app_dir, exist_ok=True)
+with open(os.path.join(app_dir, 'freed_forwarder_config.json'), 'w') as f:
+    json.dump({'listen_port': port, 'destinations': []}, f)
+
+from PyQt6.QtWidgets import QApplication
+app = QApplication(sys.argv)
+import freed_reader
+
+pkt = bytes.fromhex(sys.argv[2])
+stop = threading.Event()
+def stream():
+    tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    while not stop.is_set():
+        tx.sendto(pkt, ('127.0.0.1', port))
+        time.sleep(0.005)
+threading.Thread(target=stream, daemon=True).start()
+
+# Widen the window between receiver start and the end of __init__
+orig_start = freed_reader.BluefishLTCReader.start
+def slow_start(self):
+    time.sleep(0.05)
+    orig_start(self)
+freed_reader.BluefishLTCReader.start = slow_start
+redraws = []
+orig_ready = freed_reader.FreeDDashboard._on_packet_ready
+def counting_ready(self):
+    redraws.append(time.monotonic())
+    orig_ready(self)
+freed_reader.FreeDDashboard._on_packet_ready = counting_ready
+
+w = freed_reader.FreeDDashboard()
+end = time.monotonic() + 1.0
+while time.monotonic() < end:
+    app.processEvents()
+    time.sleep(0.002)
+stop.set()
+print(len(redraws))
+"""
+
+
+@unittest.skipUnless(
+    importlib.util.find_spec('PyQt6') and importlib.util.find_spec('numpy'),
+    'needs PyQt6 and numpy')
+class TestDashboardRedraw(unittest.TestCase):
+
+    def test_stream_running_at_startup_drives_redraws(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            env = dict(os.environ, APPDATA=tmpdir, QT_QPA_PLATFORM='offscreen')
+            root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            out = subprocess.run(
+                [sys.executable, '-c', _DASHBOARD_STREAM_SCRIPT, root,
+                 _make_packet().hex()],
+                env=env, capture_output=True, text=True, timeout=30,
+            )
+            self.assertEqual(out.returncode, 0, out.stderr)
+            # ~200 packets/s for 1 s; a stuck _update_pending gives none
+            self.assertGreater(int(out.stdout.split()[-1]), 10)
+        finally:
+            import shutil; shutil.rmtree(tmpdir, ignore_errors=True)
+
+
 if __name__ == '__main__':
     unittest.main()